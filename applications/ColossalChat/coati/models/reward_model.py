@@ -2,7 +2,7 @@
 reward model
 """
 
-from typing import Optional
+from typing import Optional, Union
 
 import torch
 import torch.nn as nn
@@ -17,13 +17,82 @@ class RewardModel(BaseModel):
     Args:
         pretrained str: huggingface or local model path
         config: PretrainedConfig object
+        checkpoint: gradient checkpointing policy, off by default. ``True``
+            checkpoints every transformer block, ``'selective'`` (or an int N)
+            checkpoints every 2nd (or Nth) block, trading a little recompute
+            for most of the memory savings.
+        precision: numeric precision for the backbone and value head. One of
+            ``'auto'``, ``'fp32'``, ``'fp16'`` or ``'bf16'``. ``'auto'`` keeps the
+            loaded dtype except on BF16-capable GPUs, where the model is cast to
+            BF16 to halve memory traffic; if ``torch_dtype`` is passed explicitly,
+            ``'auto'`` never overrides it.
         **kwargs: all other kwargs as in AutoModel.from_pretrained
     """
 
-    def __init__(self, pretrained: str = None, config: Optional[PretrainedConfig] = None, **kwargs) -> None:
+    _PRECISION_TO_DTYPE = {"fp32": torch.float32, "fp16": torch.float16, "bf16": torch.bfloat16}
+
+    def __init__(
+        self,
+        pretrained: str = None,
+        config: Optional[PretrainedConfig] = None,
+        checkpoint: Union[bool, str, int] = False,
+        precision: str = "auto",
+        **kwargs,
+    ) -> None:
+        explicit_dtype = "torch_dtype" in kwargs
         super().__init__(pretrained=pretrained, config=config, **kwargs)
-        self.value_head = nn.Linear(self.last_hidden_state_size, 1)
-        self.value_head.weight.data.normal_(mean=0.0, std=1 / (self.last_hidden_state_size + 1))
+        dtype = self._resolve_dtype(precision, explicit_dtype)
+        if dtype is not None:
+            self.model = self.model.to(dtype)
+        if checkpoint:
+            self._enable_gradient_checkpointing(checkpoint)
+        # allocate the value head directly on the backbone's device/dtype to avoid
+        # a CPU FP32 materialization followed by a copy + downcast; skip_init avoids
+        # running the default Kaiming init only to overwrite it right after
+        backbone_param = next(self.model.parameters())
+        self.value_head = nn.utils.skip_init(
+            nn.Linear, self.last_hidden_state_size, 1, device=backbone_param.device, dtype=backbone_param.dtype
+        )
+        with torch.no_grad():
+            nn.init.trunc_normal_(self.value_head.weight, std=1 / (self.last_hidden_state_size + 1))
+            nn.init.zeros_(self.value_head.bias)
+
+    def _resolve_dtype(self, precision: str, explicit_dtype: bool = False) -> Optional[torch.dtype]:
+        if precision == "auto":
+            # an explicitly requested torch_dtype always wins over the auto-cast
+            if not explicit_dtype and torch.cuda.is_available() and torch.cuda.is_bf16_supported():
+                return torch.bfloat16
+            # keep the dtype the checkpoint was loaded with
+            return None
+        if precision not in self._PRECISION_TO_DTYPE:
+            raise ValueError(f"precision must be one of 'auto', {list(self._PRECISION_TO_DTYPE)}, got {precision}")
+        return self._PRECISION_TO_DTYPE[precision]
+
+    def _enable_gradient_checkpointing(self, checkpoint: Union[bool, str, int]) -> None:
+        if checkpoint is True:
+            self.model.gradient_checkpointing_enable(gradient_checkpointing_kwargs={"use_reentrant": False})
+            return
+        every_n = 2 if checkpoint == "selective" else int(checkpoint)
+        # transformer blocks live under `layers` (llama-style) or `h` (gpt/bloom-style)
+        layers = getattr(self.model, "layers", None)
+        if layers is None:
+            layers = getattr(self.model, "h", None)
+        if layers is None:
+            # unknown backbone layout, fall back to checkpointing every block
+            self.model.gradient_checkpointing_enable(gradient_checkpointing_kwargs={"use_reentrant": False})
+            return
+        for idx, layer in enumerate(layers):
+            if idx % every_n == 0:
+                self._checkpoint_layer(layer)
+
+    @staticmethod
+    def _checkpoint_layer(layer: nn.Module) -> None:
+        forward = layer.forward
+
+        def checkpointed_forward(*args, **kwargs):
+            return torch.utils.checkpoint.checkpoint(forward, *args, use_reentrant=False, **kwargs)
+
+        layer.forward = checkpointed_forward
 
     def forward(self, input_ids: torch.LongTensor, attention_mask: Optional[torch.Tensor] = None) -> torch.Tensor:
         outputs = self.model(input_ids, attention_mask=attention_mask)
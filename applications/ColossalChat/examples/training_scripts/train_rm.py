@@ -52,6 +52,7 @@ def train(args):
         if args.use_flash_attn:
             model = RewardModel(
                 args.pretrain,
+                checkpoint="selective" if args.grad_checkpoint else False,
                 torch_dtype=torch.bfloat16 if args.mixed_precision == "bf16" else torch.float16,
                 use_flash_attention_2=True,
             )
@@ -59,6 +60,7 @@ def train(args):
         else:
             model = RewardModel(
                 args.pretrain,
+                checkpoint="selective" if args.grad_checkpoint else False,
             )
 
         if lora_config is not None:
@@ -128,7 +130,7 @@ def train(args):
     booster = Booster(plugin=plugin)
 
     if args.grad_checkpoint:
-        model.model.gradient_checkpointing_enable(gradient_checkpointing_kwargs={"use_reentrant": False})
+        # selective checkpointing is applied by the RewardModel constructor above
         coordinator.print_on_master(msg="Gradient checkpointing enabled successfully")
 
     # configure tokenizer
@@ -4,6 +4,9 @@ Script for Chinese retrieval based conversation system backed by ChatGLM
 
 import argparse
 import os
+from concurrent.futures import ThreadPoolExecutor
+
+import torch
 
 from colossalqa.chain.retrieval_qa.base import RetrievalQA
 from colossalqa.data_loader.document_loader import DocumentLoader
@@ -29,6 +32,12 @@ if __name__ == "__main__":
     parser.add_argument(
         "--sql_file_path", type=str, default=None, help="path to the a empty folder for storing sql files for indexing"
     )
+    parser.add_argument(
+        "--embedding_device",
+        type=str,
+        default=None,
+        help="device to run the embedding model on, defaults to cuda when available",
+    )
 
     args = parser.parse_args()
 
@@ -38,10 +47,17 @@ if __name__ == "__main__":
     colossal_api = ColossalAPI.get_api(args.model_name, args.model_path)
     llm = ColossalLLM(n=1, api=colossal_api)
 
-    # Setup embedding model locally
+    # Setup embedding model locally, on GPU when available, and encode documents
+    # in batches instead of one at a time to speed up index construction
+    embedding_device = args.embedding_device or ("cuda" if torch.cuda.is_available() else "cpu")
     embedding = HuggingFaceEmbeddings(
-        model_name="moka-ai/m3e-base", model_kwargs={"device": "cpu"}, encode_kwargs={"normalize_embeddings": False}
+        model_name="moka-ai/m3e-base",
+        model_kwargs={"device": embedding_device},
+        encode_kwargs={"normalize_embeddings": False, "batch_size": 64},
     )
+    if "cuda" in embedding_device:
+        # FP16 halves the encoder's memory traffic and runs on tensor cores
+        embedding.client = embedding.client.half()
     # Define the retriever
     information_retriever = CustomRetriever(k=3, sql_file_path=args.sql_file_path, verbose=True)
 
@@ -67,20 +83,26 @@ if __name__ == "__main__":
 
     # Load data to vector store
     print("Select files for constructing retriever")
-    documents = []
-    while True:
-        file = input("Enter a file path or press Enter directory without input to exit:").strip()
-        if file == "":
-            break
-        data_name = input("Enter a short description of the data:")
-        retriever_data = DocumentLoader([[file, data_name.replace(" ", "_")]]).all_data
+    text_splitter = ChineseTextSplitter()
 
-        # Split
-        text_splitter = ChineseTextSplitter()
+    def ingest(file: str, data_name: str):
+        retriever_data = DocumentLoader([[file, data_name.replace(" ", "_")]]).all_data
         splits = text_splitter.split_documents(retriever_data)
-        documents.extend(splits)
-    # Create retriever
-    information_retriever.add_documents(docs=documents, cleanup="incremental", mode="by_source", embedding=embedding)
+        # embedding and indexing run here, overlapped with the user typing the next file
+        information_retriever.add_documents(docs=splits, cleanup="incremental", mode="by_source", embedding=embedding)
+
+    # a single worker keeps the embedding model single-threaded while still
+    # pipelining load + split + embed behind the interactive prompt
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        futures = []
+        while True:
+            file = input("Enter a file path or press Enter directory without input to exit:").strip()
+            if file == "":
+                break
+            data_name = input("Enter a short description of the data:")
+            futures.append(executor.submit(ingest, file, data_name))
+        for future in futures:
+            future.result()
 
     # Set document retrieval chain, we need this chain to calculate prompt length
     memory.initiate_document_retrieval_chain(llm, PROMPT_RETRIEVAL_QA_ZH, information_retriever)
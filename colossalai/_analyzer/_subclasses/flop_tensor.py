@@ -24,6 +24,13 @@ class Phase(Enum):
     BWD = auto()
 
 
+# checking dtype membership avoids the per-call dispatcher trip of
+# Tensor.is_floating_point() in the profiling hot loop
+_FLOAT_DTYPES = frozenset(
+    {torch.float16, torch.bfloat16, torch.float32, torch.float64, torch.float8_e4m3fn, torch.float8_e5m2}
+)
+
+
 def normalize_tuple(x):
     if not isinstance(x, tuple):
         return (x,)
@@ -113,7 +120,7 @@ def flop_count(module: Union[torch.nn.Module, Callable] = None, *args, verbose:
             return rs
 
     def is_autogradable(x):
-        return isinstance(x, torch.Tensor) and x.is_floating_point()
+        return isinstance(x, torch.Tensor) and x.dtype in _FLOAT_DTYPES
 
     def create_backwards_push(name):
         class PushState(torch.autograd.Function):
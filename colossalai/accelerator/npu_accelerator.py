@@ -1,5 +1,7 @@
 #!/usr/bin/env python
 
+import functools
+import importlib.util
 from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import torch
@@ -7,22 +9,90 @@ import torch.distributed as dist
 
 from .base_accelerator import BaseAccelerator
 
-try:
-    import torch_npu  # noqa
-except ImportError:
-    pass
+_torch_npu = None
+
+
+def _ensure_npu() -> None:
+    """
+    Import torch_npu on first use, so that merely importing this module does not load
+    the CANN/HCCL shared libraries on hosts that end up selecting another accelerator.
+    """
+    global _torch_npu
+    if _torch_npu is None:
+        import torch_npu
+
+        _torch_npu = torch_npu
 
 
 __all__ = ["NpuAccelerator"]
 
 
+@functools.lru_cache(maxsize=None)
+def _cached_device_name(device_index: int) -> str:
+    return torch.npu.get_device_name(device_index)
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_device_capability(device_index: int) -> Tuple[int, int]:
+    return torch.npu.get_device_capability(device_index)
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_device_properties(device_index: int):
+    return torch.npu.get_device_properties(device_index)
+
+
 class NpuAccelerator(BaseAccelerator):
     """
     Accelerator class for Huawei NPU devices.
     """
 
+    # methods that forward their arguments unchanged to the torch.npu function of
+    # the same name; they are re-bound per instance in __init__ to drop one Python
+    # frame per call, while the defs below remain for documentation and typing
+    _PASS_THROUGH_APIS = (
+        "current_device",
+        "synchronize",
+        "is_available",
+        "device_count",
+        "utilization",
+        "get_rng_state_all",
+        "set_rng_state_all",
+        "manual_seed",
+        "manual_seed_all",
+        "seed",
+        "seed_all",
+        "initial_seed",
+        "empty_cache",
+        "memory_stats",
+        "memory_summary",
+        "memory_snapshot",
+        "memory_allocated",
+        "max_memory_allocated",
+        "reset_max_memory_allocated",
+        "reset_max_memory_cached",
+        "memory_reserved",
+        "max_memory_reserved",
+        "set_per_process_memory_fraction",
+        "reset_peak_memory_stats",
+        "current_stream",
+        "default_stream",
+        "set_stream",
+        "stream",
+    )
+
     def __init__(self):
+        _ensure_npu()
         super().__init__(name="npu", communication_backend="hccl", is_synchronous=False)
+        # cache of index -> torch.device, so get_current_device does not rebuild
+        # the device object (and its f-string) on every call
+        self._device_cache: Dict[int, torch.device] = {}
+        npu = getattr(torch, "npu", None)
+        if npu is not None:
+            for api_name in self._PASS_THROUGH_APIS:
+                npu_func = getattr(npu, api_name, None)
+                if npu_func is not None:
+                    setattr(self, api_name, npu_func)
 
     # =======================
     # device APIs
@@ -37,7 +107,11 @@ class NpuAccelerator(BaseAccelerator):
         """
         Return the current device.
         """
-        return torch.device(f"npu:{torch.npu.current_device()}")
+        idx = torch.npu.current_device()
+        device = self._device_cache.get(idx)
+        if device is None:
+            device = self._device_cache[idx] = torch.device(f"npu:{idx}")
+        return device
 
     def current_device(self) -> int:
         """
@@ -55,12 +129,6 @@ class NpuAccelerator(BaseAccelerator):
             device = dist.get_rank() % self.device_count()
         torch.npu.set_device(device)
 
-    def get_device_name(self, device: Union[torch.device, int]) -> str:
-        """
-        Return the name of the device.
-        """
-        return torch.npu.get_device_name(device)
-
     def synchronize(self, device: Union[torch.device, int] = None):
         """
         Synchronize the current process.
@@ -71,6 +139,9 @@ class NpuAccelerator(BaseAccelerator):
         """
         Check if the accelerator is available.
         """
+        if getattr(torch, "npu", None) is None:
+            # answer without executing the torch_npu import
+            return importlib.util.find_spec("torch_npu") is not None
         return torch.npu.is_available()
 
     def device_count(self):
@@ -79,23 +150,34 @@ class NpuAccelerator(BaseAccelerator):
         """
         return torch.npu.device_count()
 
+    def _dev_idx(self, device: Optional[Union[torch.device, int]] = None) -> int:
+        """
+        Normalize a device argument to an integer device index so that the
+        memoized device-property lookups can be keyed on it.
+        """
+        if isinstance(device, torch.device):
+            device = device.index
+        if device is None:
+            device = torch.npu.current_device()
+        return device
+
     def get_device_capability(self, device=None) -> Tuple[int, int]:
         """
         Gets the npu capability of a device.
         """
-        return torch.npu.get_device_capability(device)
+        return _cached_device_capability(self._dev_idx(device))
 
     def get_device_name(self, device=None) -> str:
         """
         Gets the name of a device.
         """
-        return torch.npu.get_device_name(device)
+        return _cached_device_name(self._dev_idx(device))
 
     def get_device_properties(self, device):
         """
         Gets the properties of a device.
         """
-        return torch.npu.get_device_properties(device)
+        return _cached_device_properties(self._dev_idx(device))
 
     def utilization(self, device=None) -> int:
         """
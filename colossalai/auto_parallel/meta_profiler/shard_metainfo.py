@@ -10,6 +10,41 @@ from .registry import meta_register
 
 __all__ = ["ShardMetaInfo"]
 
+# per-target resolution of (meta_func, save_fwd_in, kwargs); these only depend on
+# the target, not on the strategy, so they are shared across the many ShardMetaInfo
+# objects built for the strategies of one handler. The target itself is kept in the
+# cache entry so that ids cannot be recycled while an entry is alive.
+_target_info_cache = {}
+
+
+def _get_target_info(target: Callable):
+    key = id(target)
+    info = _target_info_cache.get(key)
+    if info is None:
+        assert meta_register.has(target.__class__) or meta_register.has(
+            target
+        ), f"Meta info for {target} is not registered."
+        if meta_register.has(target.__class__):
+            # module
+            meta_func = meta_register.get(target.__class__)
+        else:
+            # function
+            meta_func = meta_register.get(target)
+
+        # check whether the target in the list that we don't need to save activation
+        save_fwd_in = target.__class__ not in NO_SAVE_ACTIVATION
+
+        if target in INPLACE_MODULE:
+            kwargs = {"inplace": target.inplace}
+        elif target in INPLACE_OPS:
+            kwargs = {"inplace": True}
+        else:
+            kwargs = {"inplace": False}
+
+        info = (target, meta_func, save_fwd_in, kwargs)
+        _target_info_cache[key] = info
+    return info
+
 
 class ShardMetaInfo:
     """ShardMetaInfo class
@@ -92,33 +127,11 @@ class ShardMetaInfo:
         """
         Compute meta info based on sharding strategy and the given target function.
         """
-        assert meta_register.has(self._target.__class__) or meta_register.has(
-            self._target
-        ), f"Meta info for {self._target} is not registered."
-        if meta_register.has(self._target.__class__):
-            # module
-            meta_func = meta_register.get(self._target.__class__)
-
-            # check whether the target in the list that we don't need to save activation
-            save_fwd_in = self._target.__class__ not in NO_SAVE_ACTIVATION
-        else:
-            # function
-            meta_func = meta_register.get(self._target)
-
-            # check whether the target in the list that we don't need to save activation
-            save_fwd_in = self._target.__class__ not in NO_SAVE_ACTIVATION
+        _, meta_func, save_fwd_in, kwargs = _get_target_info(self._target)
 
         # construct args for meta_func
         args = [self.compute_sharded_opdata(k, v) for k, v in self._strategy.sharding_specs.items()]
 
-        # construct kwargs
-        if self.target in INPLACE_MODULE:
-            kwargs = {"inplace": self.target.inplace}
-        elif self.target in INPLACE_OPS:
-            kwargs = {"inplace": True}
-        else:
-            kwargs = {"inplace": False}
-
         # compute metainfo with meta_func
         self.compute_cost, self.memory_cost, self.fwd_in, self.fwd_buffer, self.fwd_out = meta_func(*args, **kwargs)
 
@@ -1,9 +1,11 @@
+import math
+import sys
 from typing import Dict, List, Union
 
 import torch
 import torch.nn.functional as F
 
-from colossalai.auto_parallel.tensor_shard.utils import update_partition_dim
+from colossalai.auto_parallel.tensor_shard.utils import update_partition_dims_batch
 from colossalai.logging import get_dist_logger
 from colossalai.tensor.sharding_spec import ShardingNotDivisibleError
 
@@ -14,6 +16,9 @@ from .strategy import EmbeddingStrategyGenerator, StrategyGenerator
 
 __all__ = ["EmbeddingModuleHandler", "EmbeddingFunctionHandler"]
 
+# shared module-level logger, only used in the exception branch below
+logger = get_dist_logger()
+
 
 def _convert_logical_sharding_to_physical_sharding_spec_for_embedding(
     strategy: ShardingStrategy, input_name: str, output_name: str
@@ -33,47 +38,50 @@ def _convert_logical_sharding_to_physical_sharding_spec_for_embedding(
     # get operation data
     input_op_data = strategy.get_op_data_by_name(input_name)
     output_op_data = strategy.get_op_data_by_name(output_name)
-    input_sharding_spec = strategy.get_sharding_spec_by_name(input_op_data.name)
-    output_sharding_spec = strategy.get_sharding_spec_by_name(output_op_data.name)
+    # hoist and intern the lookup keys so the per-iteration dict probes below hit
+    # the identity/short-path string comparison
+    in_name = sys.intern(input_op_data.name)
+    out_name = sys.intern(output_op_data.name)
+    mutated_spec_names = [in_name, out_name]
+    input_sharding_spec = strategy.get_sharding_spec_by_name(in_name)
+    output_sharding_spec = strategy.get_sharding_spec_by_name(out_name)
 
     # recover the last logical dimension to physical dimension
     last_logical_output_dims = len(output_op_data.logical_shape) - 1
     last_physical_output_dims = output_op_data.data.dim() - 1
 
-    # get logger for debug message
-    logger = get_dist_logger()
+    # hoist the physical shapes out of the enumeration loop
+    input_physical_shape = input_op_data.data.shape
+    output_physical_shape = output_op_data.data.shape
 
     # For the input of the embedding operation, it can be multi-dimensional. The sharding spec is only generated for
     # logical 1D non-matrix dimension, the logical non-matrix dimension can belong to the 0th to Nth dimension of the
     # physical input shape. Thus, we enumerate to get all possible cases.
-    if input_sharding_spec.dim_partition_dict:
+    # When the physical input is already 1D it matches the logical shape and the enumeration
+    # would only yield the identity mapping, so we take the no-enumeration path directly.
+    if input_sharding_spec.dim_partition_dict and input_op_data.data.dim() > 1:
         # if bool(input_sharding_spec.dim_partition_dict), it means that the
         # the generated sharding strategy does shard the non-matrix dimension,
         # in this case, we need to do enumeration
         num_input_dims = input_op_data.data.dim()
         for i in range(num_input_dims):
-            strategy_copy = strategy.clone()
-            input_sharding_spec = strategy_copy.get_sharding_spec_by_name(input_op_data.name)
-            output_sharding_spec = strategy_copy.get_sharding_spec_by_name(output_op_data.name)
+            # only the input and output specs are mutated below, so a shallow clone
+            # which copies just those two specs is enough and avoids a full deepcopy
+            strategy_copy = strategy.shallow_clone_specs(mutated_spec_names)
+            input_sharding_spec = strategy_copy.get_sharding_spec_by_name(in_name)
+            output_sharding_spec = strategy_copy.get_sharding_spec_by_name(out_name)
             try:
                 # replace the 0th dimension in the logical sharding with ith dimension in the physical sharding
-                update_partition_dim(
-                    sharding_spec=input_sharding_spec,
-                    dim_mapping={0: i},
-                    physical_shape=input_op_data.data.shape,
-                    inplace=True,
-                )
-
                 if last_logical_output_dims in output_sharding_spec.dim_partition_dict:
                     dim_mapping = {0: i, last_logical_output_dims: last_physical_output_dims}
                 else:
                     dim_mapping = {0: i}
 
-                update_partition_dim(
-                    sharding_spec=output_sharding_spec,
-                    dim_mapping=dim_mapping,
-                    physical_shape=output_op_data.data.shape,
-                    inplace=True,
+                update_partition_dims_batch(
+                    [
+                        (input_sharding_spec, {0: i}, input_physical_shape),
+                        (output_sharding_spec, dim_mapping, output_physical_shape),
+                    ]
                 )
 
                 strategy_copy.name = f"{strategy.name}_{i}"
@@ -87,25 +95,21 @@ def _convert_logical_sharding_to_physical_sharding_spec_for_embedding(
         # the generated sharding strategy does not shard the non-matrix dimension,
         # in this case, we don't need to do enumeration
         # but instead, we still need to convert the logical shape to physical shape
-        strategy_copy = strategy.clone()
-        input_sharding_spec = strategy_copy.get_sharding_spec_by_name(input_op_data.name)
-        output_sharding_spec = strategy_copy.get_sharding_spec_by_name(output_op_data.name)
+        strategy_copy = strategy.shallow_clone_specs(mutated_spec_names)
+        input_sharding_spec = strategy_copy.get_sharding_spec_by_name(in_name)
+        output_sharding_spec = strategy_copy.get_sharding_spec_by_name(out_name)
 
         # after updating, the logical shape will be replaced by the physical shape
-        update_partition_dim(
-            sharding_spec=input_sharding_spec, dim_mapping={}, physical_shape=input_op_data.data.shape, inplace=True
-        )
-
         if last_logical_output_dims in output_sharding_spec.dim_partition_dict:
             dim_mapping = {last_logical_output_dims: last_physical_output_dims}
         else:
             dim_mapping = {}
 
-        update_partition_dim(
-            sharding_spec=output_sharding_spec,
-            dim_mapping=dim_mapping,
-            physical_shape=output_op_data.data.shape,
-            inplace=True,
+        update_partition_dims_batch(
+            [
+                (input_sharding_spec, {}, input_physical_shape),
+                (output_sharding_spec, dim_mapping, output_physical_shape),
+            ]
         )
         sharding_strategies.append(strategy_copy)
 
@@ -125,12 +129,19 @@ class EmbeddingModuleHandler(ModuleHandler):
         return generators
 
     def get_operation_data_mapping(self) -> Dict[str, OperationData]:
+        # the mapping is a pure function of the node meta data, so compute it only once
+        # and reuse it across the strategy generator and post-process invocations
+        cached_mapping = getattr(self, "_op_data_mapping", None)
+        if cached_mapping is not None:
+            return cached_mapping
+
         # In nn.Embedding operation, all the dimensions of input will be treated as the batch dimension,
         # and then the sharding spec will be generated based on the logical 1D tensor.
         # After that, the logical sharding info will be enumerated among all the physical dimensions.
         # Finally, the input will be transformed back to its original shape in self.post_process
         input_meta_data = self.node.args[0]._meta_data
-        input_logical_shape = input_meta_data.view(-1).shape
+        # shape-only computation, avoids dispatching a meta-tensor view
+        input_logical_shape = torch.Size((math.prod(input_meta_data.shape),))
         physical_input_operand = OperationData(
             name=str(self.node.args[0]),
             type=OperationDataType.ARG,
@@ -148,7 +159,8 @@ class EmbeddingModuleHandler(ModuleHandler):
         # After that, the logical sharding info of batch dimension will be enumerated among all the physical dimensions.
         # Finally, the output will be transformed back to its original shape in self.post_process
         output_meta_data = self.node._meta_data
-        output_logical_shape = output_meta_data.view(-1, output_meta_data.shape[-1]).shape
+        # shape-only computation, avoids dispatching a meta-tensor view
+        output_logical_shape = torch.Size((math.prod(output_meta_data.shape[:-1]), output_meta_data.shape[-1]))
         physical_output = OperationData(
             name=str(self.node),
             type=OperationDataType.OUTPUT,
@@ -157,6 +169,7 @@ class EmbeddingModuleHandler(ModuleHandler):
         )
 
         mapping = {"input": physical_input_operand, "other": physical_other_operand, "output": physical_output}
+        self._op_data_mapping = mapping
 
         return mapping
 
@@ -186,12 +199,19 @@ class EmbeddingFunctionHandler(NodeHandler):
         return generators
 
     def get_operation_data_mapping(self) -> Dict[str, OperationData]:
+        # the mapping is a pure function of the node meta data, so compute it only once
+        # and reuse it across the strategy generator and post-process invocations
+        cached_mapping = getattr(self, "_op_data_mapping", None)
+        if cached_mapping is not None:
+            return cached_mapping
+
         # In F.embedding operation, all the dimensions of input will be treated as the batch dimension,
         # and then the sharding spec will be generated based on the logical 1D tensor.
         # After that, the logical sharding info will be enumerated among all the physical dimensions.
         # Finally, the input will be transformed back to its original shape in self.post_process
         input_meta_data = self.node.args[0]._meta_data
-        input_logical_shape = input_meta_data.view(-1).shape
+        # shape-only computation, avoids dispatching a meta-tensor view
+        input_logical_shape = torch.Size((math.prod(input_meta_data.shape),))
         physical_input_operand = OperationData(
             name=str(self.node.args[0]),
             type=OperationDataType.ARG,
@@ -215,7 +235,8 @@ class EmbeddingFunctionHandler(NodeHandler):
         # After that, the logical sharding info of batch dimension will be enumerated among all the physical dimensions.
         # Finally, the output will be transformed back to its original shape in self.post_process
         output_meta_data = self.node._meta_data
-        output_logical_shape = output_meta_data.view(-1, output_meta_data.shape[-1]).shape
+        # shape-only computation, avoids dispatching a meta-tensor view
+        output_logical_shape = torch.Size((math.prod(output_meta_data.shape[:-1]), output_meta_data.shape[-1]))
         physical_output = OperationData(
             name=str(self.node),
             type=OperationDataType.OUTPUT,
@@ -224,6 +245,7 @@ class EmbeddingFunctionHandler(NodeHandler):
         )
 
         mapping = {"input": physical_input_operand, "other": physical_other_operand, "output": physical_output}
+        self._op_data_mapping = mapping
 
         return mapping
 
@@ -19,6 +19,12 @@ class GetattrHandler(NodeHandler):
         return generators
 
     def get_operation_data_mapping(self) -> Dict[str, OperationData]:
+        # the mapping is a pure function of the node meta data, so compute it only once
+        # and reuse it across the strategy generator and post-process invocations
+        cached_mapping = getattr(self, "_op_data_mapping", None)
+        if cached_mapping is not None:
+            return cached_mapping
+
         # use transposed shape for strategies
         # the strategies will be transformed back to its original shape in self.post_process
 
@@ -30,5 +36,6 @@ class GetattrHandler(NodeHandler):
         physical_output = OperationData(name=str(self.node), type=OperationDataType.OUTPUT, data=self.node._meta_data)
 
         mapping = {"output": physical_output}
+        self._op_data_mapping = mapping
 
         return mapping
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from functools import cached_property
 from typing import Dict, List, Tuple, Union
 
 import torch
@@ -20,6 +21,149 @@ from colossalai.tensor.shape_consistency import ShapeConsistencyManager
 
 from .strategy import StrategyGenerator
 
+# ShapeConsistencyManager is a singleton, but going through the metaclass call on
+# every update_resharding_cost invocation still costs a lock + dict lookup; resolve
+# the shared instance once at module scope
+_SHAPE_CONSISTENCY_MANAGER = ShapeConsistencyManager()
+
+# element sizes for the common dtypes, so the resharding-cost loop does not have to
+# allocate an empty tensor just to read element_size(); rare dtypes fall back to the
+# allocation path and are added to the table on first sight
+_DTYPE_BYTES = {
+    torch.float32: 4,
+    torch.float16: 2,
+    torch.bfloat16: 2,
+    torch.float64: 8,
+    torch.int64: 8,
+    torch.int32: 4,
+    torch.int16: 2,
+    torch.int8: 1,
+    torch.uint8: 1,
+    torch.bool: 1,
+    torch.complex64: 8,
+    torch.complex128: 16,
+}
+
+
+# successful validity checks keyed on (spec digest, tensor shape); the check is a
+# pure function of that pair and most strategies of a handler share the same op
+# data shapes, so each unique pair only has to be verified once. Failures raise
+# and are deliberately never cached. The digest embeds id(device_mesh), so each
+# entry stores the mesh to keep its id from being recycled and hits verify mesh
+# identity before skipping the check.
+_VALIDITY_CHECKED = {}
+_VALIDITY_CHECKED_SIZE = 8192
+
+
+def _check_sharding_spec_validity_cached(sharding_spec: ShardingSpec, tensor: torch.Tensor) -> None:
+    key = (_spec_digest(sharding_spec), tuple(tensor.shape))
+    if _VALIDITY_CHECKED.get(key) is sharding_spec.device_mesh:
+        return
+    check_sharding_spec_validity(sharding_spec, tensor)
+    # stale entries (identity mismatch) are overwritten even when the cache is full
+    if key in _VALIDITY_CHECKED or len(_VALIDITY_CHECKED) < _VALIDITY_CHECKED_SIZE:
+        _VALIDITY_CHECKED[key] = sharding_spec.device_mesh
+
+
+# shared sentinel for free resharding paths; never mutated, so a single instance
+# can be appended to every zero-cost entry instead of allocating a fresh item
+_ZERO_RESHARDING_COST = TrainCycleItem(fwd=0, bwd=0, total=0)
+
+
+def _compute_resharding_cost(
+    prev_sharding_spec: Union[ShardingSpec, List[ShardingSpec]],
+    current_sharding_spec: Union[ShardingSpec, List[ShardingSpec]],
+    data: Union[torch.Tensor, List[torch.Tensor], Tuple[torch.Tensor]],
+) -> TrainCycleItem:
+    """
+    This is a helper function to compute the resharding cost for a specific strategy of a node.
+    """
+    fwd_cost = 0
+    bwd_cost = 0
+    total_cost = 0
+    # walk the (possibly nested) spec structures with an explicit worklist
+    # instead of recursing, so tuple/list outputs do not pay a Python call
+    # frame and an intermediate TrainCycleItem per element
+    worklist = [(prev_sharding_spec, current_sharding_spec, data)]
+    while worklist:
+        prev_item, current_item, data_item = worklist.pop()
+        if prev_item is None:
+            continue
+        elif isinstance(prev_item, ShardingSpec):
+            if prev_item is current_item or (
+                prev_item.entire_shape == current_item.entire_shape
+                and prev_item.dim_partition_dict == current_item.dim_partition_dict
+            ):
+                # the tensor is already in the target layout, resharding is free
+                continue
+            if isinstance(data_item, torch.Tensor):
+                size_per_elem_bytes = _dtype_bytes(data_item.dtype)
+                consistency_cost = _consistency_cost(prev_item, current_item)
+                fwd_cost += consistency_cost["forward"] * size_per_elem_bytes
+                bwd_cost += consistency_cost["backward"] * size_per_elem_bytes
+                total_cost += consistency_cost["total"] * size_per_elem_bytes
+            else:
+                # This raise is used to check if we have missed any type of data.
+                # It could be merged into Parameter branch, which means we won't handle
+                # non-tensor arguments.
+                raise ValueError(f"Unsupported data type {type(data_item)}")
+        else:
+            assert isinstance(
+                prev_item, (tuple, list)
+            ), f"prev_sharding_spec should be in type of ShardingSpec, List[ShardingSpec], \
+                    or Tuple[ShardingSpec], but got {type(prev_item)}"
+            worklist.extend(zip(prev_item, current_item, data_item))
+
+    if fwd_cost == 0 and bwd_cost == 0 and total_cost == 0:
+        return _ZERO_RESHARDING_COST
+    return TrainCycleItem(fwd=fwd_cost, bwd=bwd_cost, total=total_cost)
+
+
+def _dtype_bytes(dtype: torch.dtype) -> int:
+    num_bytes = _DTYPE_BYTES.get(dtype)
+    if num_bytes is None:
+        num_bytes = _DTYPE_BYTES[dtype] = torch.empty((), dtype=dtype).element_size()
+    return num_bytes
+
+
+# cache of consistency costs keyed on structural digests of the (source, target)
+# spec pair; in transformer graphs a handful of pairs repeat across thousands of
+# node/strategy combinations, so the greedy path search only runs once per pair.
+# The digests embed id(device_mesh), so entries keep the mesh objects alive and
+# hits verify mesh identity; otherwise a later solve's mesh allocated at a
+# recycled id could be served costs computed against a different topology.
+_CONSISTENCY_COST_CACHE = {}
+_CONSISTENCY_COST_CACHE_SIZE = 4096
+
+
+def _spec_digest(spec: ShardingSpec) -> Tuple:
+    # specs carry a precomputed structural digest; fall back to computing it for
+    # spec-like objects built outside ShardingSpec.__init__
+    digest = getattr(spec, "_digest", None)
+    if digest is None:
+        digest = (
+            id(spec.device_mesh),
+            tuple(spec.entire_shape),
+            tuple(sorted((dim, tuple(axes)) for dim, axes in spec.dim_partition_dict.items())),
+        )
+    return digest
+
+
+def _consistency_cost(prev_sharding_spec: ShardingSpec, current_sharding_spec: ShardingSpec) -> Dict[str, float]:
+    key = (_spec_digest(prev_sharding_spec), _spec_digest(current_sharding_spec))
+    entry = _CONSISTENCY_COST_CACHE.get(key)
+    if (
+        entry is not None
+        and entry[0] is prev_sharding_spec.device_mesh
+        and entry[1] is current_sharding_spec.device_mesh
+    ):
+        return entry[2]
+    _, _, cost = _SHAPE_CONSISTENCY_MANAGER.shape_consistency(prev_sharding_spec, current_sharding_spec)
+    # stale entries (identity mismatch) are overwritten even when the cache is full
+    if key in _CONSISTENCY_COST_CACHE or len(_CONSISTENCY_COST_CACHE) < _CONSISTENCY_COST_CACHE_SIZE:
+        _CONSISTENCY_COST_CACHE[key] = (prev_sharding_spec.device_mesh, current_sharding_spec.device_mesh, cost)
+    return cost
+
 
 class NodeHandler(ABC):
     """
@@ -40,12 +184,23 @@ class NodeHandler(ABC):
         solver_perference: SolverPerference = SolverPerference.STANDARD,
     ) -> None:
         self.node = node
-        self.predecessor_node = list(node._input_nodes.keys())
-        self.successor_node = list(node.users.keys())
         self.device_mesh = device_mesh
         self.strategies_vector = strategies_vector
         self.shard_option = shard_option
         self.solver_perference = solver_perference
+        # per-predecessor cache of the sharding specs exposed by the predecessor's
+        # strategy vector, shared across all strategies of this handler
+        self._prev_specs_cache = {}
+
+    # materialized lazily: many handlers (e.g. runs with compute_resharding_cost
+    # disabled) never read these, so avoid two list allocations per graph node
+    @cached_property
+    def predecessor_node(self) -> List[Node]:
+        return list(self.node._input_nodes)
+
+    @cached_property
+    def successor_node(self) -> List[Node]:
+        return list(self.node.users)
 
     def update_resharding_cost(self, strategy: ShardingStrategy) -> None:
         """
@@ -53,7 +208,10 @@ class NodeHandler(ABC):
         """
         # TODO: test this function when other handlers are ready
         resharding_costs = {}
-        shape_consistency_manager = ShapeConsistencyManager()
+
+        # index the op data by name once, so the per-predecessor membership test and
+        # lookup below are O(1) instead of a linear scan over the sharding specs
+        name_to_op_data = {op_data.name: op_data for op_data in strategy.sharding_specs}
 
         for node in self.predecessor_node:
             node_name = str(node)
@@ -61,75 +219,50 @@ class NodeHandler(ABC):
 
             # we will not compute the resharding costs for the node not counted in the strategy.
             # And the node with tuple or list output need to be handled below.
-            node_in_strategy = [op_data.name for op_data in strategy.sharding_specs.keys()]
-            if str(node) not in node_in_strategy:
+            op_data = name_to_op_data.get(node_name)
+            if op_data is None:
                 continue
 
-            op_data = strategy.get_op_data_by_name(node_name)
             current_sharding_spec = strategy.sharding_specs[op_data]
-            # get the sharding specs for this node generated
-            # in its own node handler
-            assert hasattr(
-                node, "strategies_vector"
-            ), f"The predecessor node {node_name} has no strategy vector to compute the resharding cost."
-            prev_strategy_vector = node.strategies_vector
-            prev_sharding_specs = [
-                prev_strategy.get_sharding_spec_by_name(node_name) for prev_strategy in prev_strategy_vector
-            ]
+            # get the sharding specs for this node generated in its own node handler;
+            # the predecessor's strategy vector is fixed while this handler registers
+            # its strategies, so the spec list is cached across the strategy loop
+            prev_sharding_specs = self._prev_specs_cache.get(node)
+            if prev_sharding_specs is None:
+                prev_strategy_vector = getattr(node, "strategies_vector", None)
+                if prev_strategy_vector is None:
+                    raise AssertionError(
+                        f"The predecessor node {node_name} has no strategy vector to compute the resharding cost."
+                    )
+                prev_sharding_specs = [
+                    prev_strategy.get_sharding_spec_by_name(node_name) for prev_strategy in prev_strategy_vector
+                ]
+                self._prev_specs_cache[node] = prev_sharding_specs
 
             # create data structure to store costs
             if node not in resharding_costs:
                 resharding_costs[node] = []
 
-            def _compute_resharding_cost(
-                prev_sharding_spec: Union[ShardingSpec, List[ShardingSpec]],
-                current_sharding_spec: Union[ShardingSpec, List[ShardingSpec]],
-                data: Union[torch.Tensor, List[torch.Tensor], Tuple[torch.Tensor]],
-            ) -> TrainCycleItem:
-                """
-                This is a helper function to compute the resharding cost for a specific strategy of a node.
-                """
-                if prev_sharding_spec is None:
-                    return TrainCycleItem(fwd=0, bwd=0, total=0)
-                elif isinstance(prev_sharding_spec, ShardingSpec):
-                    if isinstance(data, torch.Tensor):
-                        dtype = data.dtype
-                        size_per_elem_bytes = torch.tensor([], dtype=dtype).element_size()
-                        _, _, consistency_cost = shape_consistency_manager.shape_consistency(
-                            prev_sharding_spec, current_sharding_spec
+            # placeholder/get_attr predecessors expose a single fixed sharding spec;
+            # when it already matches the spec this strategy expects, the only entry
+            # in the cost column is the shared zero item and the consistency search
+            # can be skipped altogether. This covers every parameter input in large
+            # models, where each weight is a get_attr node.
+            if node.op in ("placeholder", "get_attr") and len(prev_sharding_specs) == 1:
+                prev_spec = prev_sharding_specs[0]
+                if (
+                    isinstance(prev_spec, ShardingSpec)
+                    and isinstance(current_sharding_spec, ShardingSpec)
+                    and (
+                        prev_spec is current_sharding_spec
+                        or (
+                            prev_spec.entire_shape == current_sharding_spec.entire_shape
+                            and prev_spec.dim_partition_dict == current_sharding_spec.dim_partition_dict
                         )
-
-                        resharding_cost = TrainCycleItem(
-                            fwd=consistency_cost["forward"] * size_per_elem_bytes,
-                            bwd=consistency_cost["backward"] * size_per_elem_bytes,
-                            total=consistency_cost["total"] * size_per_elem_bytes,
-                        )
-                        return resharding_cost
-                    else:
-                        # This raise is used to check if we have missed any type of data.
-                        # It could be merged into Parameter branch, which means we won't handle
-                        # non-tensor arguments.
-                        raise ValueError(f"Unsupported data type {type(data)}")
-                else:
-                    assert isinstance(
-                        prev_sharding_spec, (tuple, list)
-                    ), f"prev_sharding_spec should be in type of ShardingSpec, List[ShardingSpec], \
-                            or Tuple[ShardingSpec], but got {type(prev_sharding_spec)}"
-
-                    fwd_cost = 0
-                    bwd_cost = 0
-                    total_cost = 0
-                    for index, (prev_sharding_spec_item, current_sharding_spec_item) in enumerate(
-                        zip(prev_sharding_spec, current_sharding_spec)
-                    ):
-                        item_cost = _compute_resharding_cost(
-                            prev_sharding_spec_item, current_sharding_spec_item, data[index]
-                        )
-                        fwd_cost += item_cost.fwd
-                        bwd_cost += item_cost.bwd
-                        total_cost += item_cost.total
-                    resharding_cost = TrainCycleItem(fwd=fwd_cost, bwd=bwd_cost, total=total_cost)
-                    return resharding_cost
+                    )
+                ):
+                    resharding_costs[node].append(_ZERO_RESHARDING_COST)
+                    continue
 
             # for each sharding spec generated by the predecessor's node handler
             # compute the resharding cost to switch to the sharding spec generated
@@ -167,54 +300,54 @@ class NodeHandler(ABC):
         for generator in strategy_generators:
             strategies = generator.generate()
 
-            # postprocess a strategy
-            # postprocess can produce one strategy or multiple strategies
-            post_processed_strategies_map = map(self.post_process, strategies)
-            post_processed_strategies = []
-
-            for strategy in post_processed_strategies_map:
-                if isinstance(strategy, (list, tuple)):
-                    post_processed_strategies.extend(strategy)
-                else:
-                    post_processed_strategies.append(strategy)
-
-            # compute the resharding costs based on the previous node
-            # strategies if specified
-            if compute_resharding_cost:
-                updated_strategies = map(self.update_resharding_cost, post_processed_strategies)
-                post_processed_strategies = list(updated_strategies)
-
-            self.strategies_vector.extend(post_processed_strategies)
-
-        # validating the correctness of the sharding strategy
-        for strategy in self.strategies_vector:
-            for op_data, sharding_spec in strategy.sharding_specs.items():
-                if op_data.data is not None and isinstance(op_data.data, torch.Tensor):
-                    check_sharding_spec_validity(sharding_spec, op_data.data)
-
+            # post-process each strategy (which can fan out into several), compute the
+            # resharding cost when requested and append to the vector in one pass,
+            # without materializing intermediate lists
+            for strategy in strategies:
+                post_processed = self.post_process(strategy)
+                if not isinstance(post_processed, (list, tuple)):
+                    post_processed = (post_processed,)
+                for post_processed_strategy in post_processed:
+                    if compute_resharding_cost:
+                        self.update_resharding_cost(post_processed_strategy)
+                    self.strategies_vector.append(post_processed_strategy)
+
+        # validate the sharding strategies and collect the shard-option filtering
+        # info in the same traversal of the sharding specs
         remove_strategy_list = []
+        # hoist the loop-invariant filter inputs out of the strategy loop; with the
+        # default STANDARD option no strategy is ever filtered, so the shard-axis
+        # collection can be skipped entirely
+        last_axis = len(self.device_mesh.shape) - 1
+        shard_option = self.shard_option
+        need_filter = shard_option != ShardOption.STANDARD
         for strategy in self.strategies_vector:
-            shard_axis_list = []
-            last_axis = len(self.device_mesh.shape) - 1
+            shard_axis_set = set()
             for op_data, sharding_spec in strategy.sharding_specs.items():
                 if op_data.data is not None and isinstance(op_data.data, torch.Tensor):
-                    for dim, shard_axes in sharding_spec.dim_partition_dict.items():
-                        for shard_axis in shard_axes:
-                            if shard_axis not in shard_axis_list:
-                                shard_axis_list.append(shard_axis)
-
-            shard_level = len(shard_axis_list)
-            using_last_axis = last_axis in shard_axis_list or -1 in shard_axis_list
-            if self.shard_option == ShardOption.SHARD and shard_level == 0:
+                    _check_sharding_spec_validity_cached(sharding_spec, op_data.data)
+                    if need_filter:
+                        for dim, shard_axes in sharding_spec.dim_partition_dict.items():
+                            shard_axis_set.update(shard_axes)
+
+            if not need_filter:
+                continue
+            shard_level = len(shard_axis_set)
+            if shard_option == ShardOption.SHARD and shard_level == 0:
                 remove_strategy_list.append(strategy)
-            if self.shard_option == ShardOption.FULL_SHARD and shard_level <= 1:
+            elif shard_option == ShardOption.FULL_SHARD and shard_level <= 1:
                 remove_strategy_list.append(strategy)
-            if self.shard_option == ShardOption.SHARD_LAST_AXIS:
-                if shard_level != 1 or using_last_axis == False:
+            elif shard_option == ShardOption.SHARD_LAST_AXIS:
+                using_last_axis = last_axis in shard_axis_set or -1 in shard_axis_set
+                if shard_level != 1 or not using_last_axis:
                     remove_strategy_list.append(strategy)
 
-        for strategy in remove_strategy_list:
-            self.strategies_vector.remove(strategy)
+        if remove_strategy_list:
+            # rebuild in one pass instead of repeated list.remove scans; the slice
+            # assignment keeps the StrategiesVector object identity intact for any
+            # code holding a reference to it
+            remove_ids = {id(strategy) for strategy in remove_strategy_list}
+            self.strategies_vector[:] = [s for s in self.strategies_vector if id(s) not in remove_ids]
 
         return self.strategies_vector
 
@@ -252,12 +385,26 @@ class NodeHandler(ABC):
         """
 
 
-class MetaInfoNodeHandler(NodeHandler):
-    """
-    This is a base class to handle the nodes patched in the meta profiler.
+# per-target cache of the meta_register membership probe; the same targets (e.g.
+# nn.Linear modules, aten ops) recur across thousands of handlers. Entries keep a
+# reference to the target so ids cannot be recycled while cached.
+_META_REGISTER_CACHE = {}
 
-    Note: this class will be integrated into the NodeHandler class in the future, after
-    all the functions are patched.
+
+def _target_is_patched(target) -> bool:
+    key = id(target)
+    entry = _META_REGISTER_CACHE.get(key)
+    if entry is None:
+        entry = (target, meta_register.has(target.__class__) or meta_register.has(target))
+        _META_REGISTER_CACHE[key] = entry
+    return entry[1]
+
+
+class MetaInfoHandlerMixin:
+    """
+    A mixin which rewrites the strategy costs with the ShardMetaInfo class after
+    strategy registration. It is shared by MetaInfoNodeHandler and
+    MetaInfoModuleHandler, whose register_strategy implementations were identical.
     """
 
     def register_strategy(self, compute_resharding_cost: bool = True) -> StrategiesVector:
@@ -270,7 +417,7 @@ class MetaInfoNodeHandler(NodeHandler):
         # Currently we haven't patched all the torch functions and modules, so if the target
         # is not patched, we will use the default cost model to compute the cost.
         # TODO: patch all torch functions and modules to make it clean
-        if meta_register.has(target.__class__) or meta_register.has(target):
+        if _target_is_patched(target):
             strategies_info = []
             for strategy in self.strategies_vector:
                 metainfo = ShardMetaInfo(strategy, target)
@@ -283,11 +430,20 @@ class MetaInfoNodeHandler(NodeHandler):
 
         else:
             logger = get_dist_logger()
-            logger.warning(f"The target function {target} is not patched yet, ")
+            logger.warning(f"The target function {target} is not patched yet")
 
         return self.strategies_vector
 
 
+class MetaInfoNodeHandler(MetaInfoHandlerMixin, NodeHandler):
+    """
+    This is a base class to handle the nodes patched in the meta profiler.
+
+    Note: this class will be integrated into the NodeHandler class in the future, after
+    all the functions are patched.
+    """
+
+
 class ModuleHandler(NodeHandler):
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
@@ -307,37 +463,10 @@ class ModuleHandler(NodeHandler):
         self.named_buffers = named_buffers
 
 
-class MetaInfoModuleHandler(ModuleHandler):
+class MetaInfoModuleHandler(MetaInfoHandlerMixin, ModuleHandler):
     """
     This is a base class to handle the module patched in the meta profiler.
 
     Note: this class will be integrated into the ModuleHandler class in the future, after
     all the modules are patched.
     """
-
-    def register_strategy(self, compute_resharding_cost: bool = True) -> StrategiesVector:
-        """
-        This method is inherited from NodeHandler. It will register the strategies first,
-        and rewrite the memory_cost and compute_cost of the strategy using the ShardMetaInfo class.
-        """
-        super().register_strategy(compute_resharding_cost=compute_resharding_cost)
-        target = self.get_target_function()
-        # Currently we haven't patched all the torch functions and modules, so if the target
-        # is not patched, we will use the default cost model to compute the cost.
-        # TODO: patch all torch functions and modules to make it clean
-        if meta_register.has(target.__class__) or meta_register.has(target):
-            strategies_info = []
-            for strategy in self.strategies_vector:
-                metainfo = ShardMetaInfo(strategy, target)
-                strategy.compute_cost = metainfo.compute_cost
-                strategy.memory_cost = metainfo.memory_cost
-                strategies_info.append(metainfo)
-
-            # attach metainfos to the handler
-            setattr(self, "strategies_info", strategies_info)
-
-        else:
-            logger = get_dist_logger()
-            logger.warning(f"The target function {target} is not patched yet")
-
-        return self.strategies_vector
@@ -169,8 +169,9 @@ class StrategyGenerator(ABC):
 
         def _compute_and_add(op_data: OperationData, comm_spec: CommSpec):
             num_ele_in_comm = comm_spec.get_comm_cost()
-            dtype = op_data.data.dtype
-            size_per_elem_bytes = torch.tensor([], dtype=dtype).element_size()
+            size_per_elem_bytes = op_data.size_per_elem_bytes
+            if size_per_elem_bytes is None:
+                size_per_elem_bytes = torch.tensor([], dtype=op_data.data.dtype).element_size()
             for phase, cost in num_ele_in_comm.items():
                 num_ele_in_comm[phase] = num_ele_in_comm[phase] * size_per_elem_bytes
             comm_cost.fwd += num_ele_in_comm["forward"]
@@ -1,4 +1,4 @@
-from copy import deepcopy
+from copy import copy, deepcopy
 from dataclasses import dataclass
 from enum import Enum
 from typing import Any, Dict, List, Tuple, Union
@@ -50,6 +50,13 @@ class OperationData:
     logical_shape: Tuple[int] = None
 
     def __post_init__(self):
+        # pre-compute the per-element byte size once, so cost computations on the
+        # solve hot path do not have to re-query the dtype per call
+        if isinstance(self.data, torch.Tensor):
+            self.size_per_elem_bytes = self.data.element_size()
+        else:
+            self.size_per_elem_bytes = None
+
         # if no logical shape is specified, use the data shape as the logical shape
         if self.logical_shape is None:
 
@@ -90,6 +97,10 @@ class TrainCycleItem:
         bwd (float): the item for the backward pass
     """
 
+    # these objects are created in huge numbers on the strategy-registration hot
+    # path; slots keep them dict-free and cheap to allocate
+    __slots__ = ("fwd", "bwd", "total")
+
     fwd: Any
     bwd: Any
     total: Any
@@ -193,17 +204,47 @@ class ShardingStrategy:
         specs = {k: v for k, v in self.sharding_specs.items() if k.type == operation_data_type}
         return specs
 
+    def _get_name_index(self) -> Dict[str, OperationData]:
+        # lazily build a name -> op data index so the by-name lookups are O(1);
+        # the cache is keyed on the current sharding_specs dict (and its length)
+        # so replacing or extending the dict transparently rebuilds the index
+        specs = self.sharding_specs
+        cached = self.__dict__.get("_name_index")
+        if cached is None or cached[0] is not specs or len(cached[1]) != len(specs):
+            index = {op_data.name: op_data for op_data in specs}
+            self.__dict__["_name_index"] = (specs, index)
+            return index
+        return cached[1]
+
     def get_op_data_by_name(self, name: str):
-        for op_data in self.sharding_specs.keys():
-            if op_data.name == name:
-                return op_data
-        raise KeyError(f"Could not find the OperationData with name {name}")
+        op_data = self._get_name_index().get(name)
+        if op_data is None:
+            raise KeyError(f"Could not find the OperationData with name {name}")
+        return op_data
 
     def get_sharding_spec_by_name(self, name: str):
-        for op_data, sharding_spec in self.sharding_specs.items():
-            if op_data.name == name:
-                return sharding_spec
-        raise KeyError(f"Could not find the ShardingSpec for OperationData with name {name}")
+        op_data = self._get_name_index().get(name)
+        if op_data is None:
+            raise KeyError(f"Could not find the ShardingSpec for OperationData with name {name}")
+        return self.sharding_specs[op_data]
+
+    def shallow_clone_specs(self, names: List[str]) -> "ShardingStrategy":
+        """
+        Create a copy of this strategy which shares every field with the original except
+        the sharding specs of the given operation data names, which are deep-copied so
+        that they can be mutated independently. This is much cheaper than clone() when
+        only a few specs need to be rewritten, e.g. during logical-to-physical conversion.
+
+        Args:
+            names (List[str]): the names of the OperationData objects whose specs will be deep-copied.
+        """
+        cloned_strategy = copy(self)
+        names = set(names)
+        cloned_strategy.sharding_specs = {
+            op_data: deepcopy(spec) if op_data.name in names else spec
+            for op_data, spec in self.sharding_specs.items()
+        }
+        return cloned_strategy
 
     def clone(self):
         def _deepcopy_dict_vals(data: Dict):
@@ -14,6 +14,7 @@ from .sharding import (
     generate_sharding_size,
     transpose_partition_dim,
     update_partition_dim,
+    update_partition_dims_batch,
 )
 
 __all__ = [
@@ -26,6 +27,7 @@ __all__ = [
     "ignore_sharding_exception",
     "check_sharding_spec_validity" "transpose_partition_dim",
     "update_partition_dim",
+    "update_partition_dims_batch",
     "enumerate_all_possible_1d_sharding",
     "enumerate_all_possible_2d_sharding",
     "generate_sharding_size",
@@ -1,7 +1,7 @@
 import operator
 from copy import deepcopy
 from functools import reduce
-from typing import Dict
+from typing import Dict, List, Tuple
 
 import torch
 
@@ -10,6 +10,7 @@ from colossalai.tensor.sharding_spec import ShardingSpec
 __all__ = [
     "transpose_partition_dim",
     "update_partition_dim",
+    "update_partition_dims_batch",
     "enumerate_all_possible_1d_sharding",
     "enumerate_all_possible_2d_sharding",
     "generate_sharding_size",
@@ -85,6 +86,50 @@ def update_partition_dim(
     return current_sharding_spec
 
 
+def update_partition_dims_batch(updates: List[Tuple[ShardingSpec, Dict[int, int], torch.Size]]) -> None:
+    """
+    In-place logical-to-physical update of several sharding specs in one pass.
+
+    Each entry carries ``(sharding_spec, dim_mapping, physical_shape)`` with the same semantics
+    as :func:`update_partition_dim` with ``inplace=True``. The new specs for the whole batch are
+    built and validated up front before any input spec is re-initialized, so if any entry fails
+    the sanity checks (e.g. with ``ShardingNotDivisibleError``) every input is left unmodified.
+
+    Args:
+        updates (List[Tuple[ShardingSpec, Dict[int, int], torch.Size]]): the specs to update with
+            their logical-to-physical dim mappings and physical shapes.
+    """
+    pending = []
+    for sharding_spec, dim_mapping, physical_shape in updates:
+        old_dim_partition_dict = dict(sharding_spec.dim_partition_dict)
+        new_dim_partition_dict = {}
+
+        # assign new dim
+        for old_dim, new_dim in dim_mapping.items():
+            new_dim_partition_dict[new_dim] = old_dim_partition_dict.pop(old_dim)
+
+        for tensor_dim, mesh_dims in old_dim_partition_dict.items():
+            if tensor_dim in new_dim_partition_dict:
+                raise KeyError(f"There are duplicated entries for the tensor sharding dimension {tensor_dim}")
+            new_dim_partition_dict[tensor_dim] = mesh_dims
+
+        # constructing the new spec runs the sanity checks without touching the input
+        new_spec = ShardingSpec(
+            device_mesh=sharding_spec.device_mesh,
+            entire_shape=physical_shape,
+            dim_partition_dict=new_dim_partition_dict,
+        )
+        pending.append((sharding_spec, new_spec))
+
+    # commit only after every entry has been validated
+    for sharding_spec, new_spec in pending:
+        sharding_spec.__init__(
+            device_mesh=new_spec.device_mesh,
+            entire_shape=new_spec.entire_shape,
+            dim_partition_dict=new_spec.dim_partition_dict,
+        )
+
+
 def enumerate_all_possible_2d_sharding(mesh_dim_0, mesh_dim_1, dim_size):
     dim_partition_list = []
     # enumerate all the 2D sharding cases
@@ -1,20 +1,22 @@
 import enum
 import os
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import nullcontext
 from functools import partial
 from pathlib import Path
 from types import MethodType
-from typing import Callable, Dict, Iterator, List, Optional, Tuple
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
 
 import torch
 import torch.distributed
 import torch.distributed as dist
 import torch.nn as nn
+from packaging.version import Version
 from torch.distributed.distributed_c10d import _get_default_group
 from torch.nn import Parameter
 from torch.optim import Optimizer
 from torch.optim.lr_scheduler import _LRScheduler as LRScheduler
-from torch.utils._pytree import tree_map
+from torch.utils._pytree import tree_flatten, tree_map, tree_unflatten
 from torch.utils.data import DataLoader
 
 from colossalai.accelerator import get_accelerator
@@ -52,7 +54,7 @@ def _convert_floating_point(x, dtype: torch.dtype = torch.float16):
     return x
 
 
-SUPPORTED_PRECISION = ["fp16", "bf16", "fp32"]
+SUPPORTED_PRECISION = ["fp16", "bf16", "fp32", "tf32"]
 
 
 class OptimizerParamCheckState(enum.Enum):
@@ -69,6 +71,7 @@ class LowLevelZeroModel(ModelWrapper, AMPModelMixin):
         overlap_allgather: bool = False,
         cast_inputs: bool = True,
         use_fp8: bool = False,
+        compile: bool = False,
     ) -> None:
         super().__init__(module)
         self.dtype = None
@@ -76,9 +79,20 @@ class LowLevelZeroModel(ModelWrapper, AMPModelMixin):
             self.dtype = torch.float16
         elif precision == "bf16":
             self.dtype = torch.bfloat16
+        elif precision == "tf32":
+            # params and numerics stay fp32; only the matmul/conv kernels are allowed
+            # to use the tf32 tensor cores (no-op before Ampere)
+            torch.backends.cuda.matmul.allow_tf32 = True
+            torch.backends.cudnn.allow_tf32 = True
         if self.dtype is not None:
             module = module.to(self.dtype)
         module = module.to(get_accelerator().get_current_device())
+        if compile:
+            assert Version(torch.__version__) >= Version("2.0.0"), "torch.compile requires torch>=2.0.0"
+            # reduce-overhead captures cuda graphs for the steady-state step;
+            # fullgraph is left off so dynamic control flow falls back to eager
+            # instead of raising
+            module = torch.compile(module, mode="reduce-overhead", fullgraph=False)
         self.module = module
         self.convert_fn = None
         self.use_fp8 = use_fp8
@@ -98,11 +112,24 @@ class LowLevelZeroModel(ModelWrapper, AMPModelMixin):
 
     def forward(self, *args, **kwargs):
         if self.convert_fn is not None:
-            args = tree_map(self.convert_fn, args)
-            kwargs = tree_map(self.convert_fn, kwargs)
+            args, kwargs = self._cast_floating_point_inputs(args, kwargs)
         with self._hook_context():
             return super().forward(*args, **kwargs)
 
+    def _cast_floating_point_inputs(self, args, kwargs):
+        # flatten args and kwargs once instead of running two tree_map traversals,
+        # and only rebuild the trees when at least one leaf actually changed dtype
+        flat, spec = tree_flatten((args, kwargs))
+        dtype = self.dtype
+        cast_any = False
+        for idx, leaf in enumerate(flat):
+            if isinstance(leaf, torch.Tensor) and torch.is_floating_point(leaf) and leaf.dtype != dtype:
+                flat[idx] = leaf.to(dtype)
+                cast_any = True
+        if not cast_any:
+            return args, kwargs
+        return tree_unflatten(flat, spec)
+
     def _force_wait_all_gather(self):
         for p in self.module.parameters():
             wait_all_gather_handle(p)
@@ -172,20 +199,38 @@ class LowLevelZeroCheckpointIO(TorchDDPCheckpointIO):
             group_file_path = os.path.join(checkpoint, param_group_file)
             save_param_groups(state_dict, group_file_path)
 
-        # Save shards of optimizer states.
+        # Save shards of optimizer states. The states in each shard have already been
+        # all-gathered by `state_dict_shard`, so the shard stream is identical on every
+        # rank; instead of funneling all writes through the master, the shards are
+        # written round-robin so the aggregate disk bandwidth scales with the number
+        # of ranks. The index bookkeeping is deterministic and thus consistent with
+        # what the master writes to the index file.
         total_size = 0
-        for idx, shard_pair in enumerate(sharded_state):
-            shard, current_size = shard_pair
-            shard_file = get_shard_filename(states_name, idx)
-            total_size = total_size + current_size
-            for param_id in shard.keys():
-                index_file.append_weight_map(str(param_id), shard_file)
-
-            checkpoint_file_path = os.path.join(checkpoint, shard_file)
-            if self.coordinator.is_master():
-                save_state_dict(shard, checkpoint_file_path, use_safetensors=False)
-
-        # Wrap up index file.
+        writer_rank = self.coordinator.rank
+        world_size = self.coordinator.world_size
+        # a single background writer lets the disk flush of shard N overlap with the
+        # all-gather and serialization of shard N+1 instead of alternating between them
+        with ThreadPoolExecutor(max_workers=1) as writer:
+            write_futures = []
+            for idx, shard_pair in enumerate(sharded_state):
+                shard, current_size = shard_pair
+                shard_file = get_shard_filename(states_name, idx)
+                total_size = total_size + current_size
+                # one bulk update per shard instead of a method call per parameter
+                index_file.append_weight_maps((str(param_id) for param_id in shard.keys()), shard_file)
+
+                checkpoint_file_path = os.path.join(checkpoint, shard_file)
+                if idx % world_size == writer_rank:
+                    write_futures.append(
+                        writer.submit(save_state_dict, shard, checkpoint_file_path, use_safetensors=False)
+                    )
+            # surface any write error on this rank before the barrier
+            for future in write_futures:
+                future.result()
+
+        # Wrap up index file. Wait for all ranks to finish their writes first so the
+        # index never references a shard file that is still in flight.
+        self.coordinator.block_all()
         index_file.append_meta_data("total_size", total_size)
         if self.coordinator.is_master():
             index_file.write_index_file(save_index_file)
@@ -221,21 +266,29 @@ class LowLevelZeroCheckpointIO(TorchDDPCheckpointIO):
 
         checkpoint_files, _ = ckpt_index_file.get_checkpoint_filenames()
 
+        world_size = self.coordinator.world_size
+        rank = self.coordinator.rank
         for shard_file in checkpoint_files:
             state_dict = load_shard_state_dict(Path(shard_file), use_safetensors=False)
-            # shard state dict
+            # slice out this rank's shard directly instead of padding the full state
+            # and splitting it into world_size chunks that are thrown away; narrow
+            # avoids both the padded copy and the O(world_size) chunk objects
             for param_idx, state in state_dict.items():
                 for k, v in state.items():
                     if isinstance(v, torch.Tensor) and k != "step":
-                        padding_size = (
-                            self.coordinator.world_size - v.numel() % self.coordinator.world_size
-                        ) % self.coordinator.world_size
+                        shard_numel = (v.numel() + world_size - 1) // world_size
+                        start = rank * shard_numel
                         with torch.no_grad():
                             v = v.flatten()
-                            if padding_size > 0:
-                                v = torch.nn.functional.pad(v, [0, padding_size])
-                            v_list = v.split(v.numel() // self.coordinator.world_size)
-                            state_dict[param_idx][k] = v_list[self.coordinator.rank].detach().clone()
+                            if start + shard_numel <= v.numel():
+                                shard = v.narrow(0, start, shard_numel).detach().clone()
+                            else:
+                                # this rank owns (part of) the zero-padded tail
+                                shard = v.new_zeros(shard_numel)
+                                valid_numel = v.numel() - start
+                                if valid_numel > 0:
+                                    shard[:valid_numel].copy_(v[start:])
+                            state_dict[param_idx][k] = shard
             load_states_into_optimizer(optimizer, state_dict, id_map)
         sharded_optimizer_loading_epilogue(optimizer)
 
@@ -315,7 +368,8 @@ class LowLevelZeroPlugin(DPPluginBase):
 
     Args:
         stage (int, optional): ZeRO stage. Defaults to 1.
-        precision (str, optional): precision. Support 'fp16', 'bf16' and 'fp32'. Defaults to 'fp16'.
+        precision (str, optional): precision. Support 'fp16', 'bf16', 'fp32' and 'tf32'. 'tf32' keeps fp32
+            parameters but lets matmul/conv kernels use tf32 tensor cores. Defaults to 'fp16'.
         initial_scale (float, optional): Initial scale used by DynamicGradScaler. Defaults to 2**32.
         min_scale (float, optional): Min scale used by DynamicGradScaler. Defaults to 1.
         growth_factor (float, optional): growth_factor used by DynamicGradScaler. Defaults to 2.
@@ -326,13 +380,17 @@ class LowLevelZeroPlugin(DPPluginBase):
         max_norm (float, optional): max_norm used for `clip_grad_norm`. You should notice that you shall not do
             clip_grad_norm by yourself when using ZeRO DDP. The ZeRO optimizer will take care of clip_grad_norm.
         norm_type (float, optional): norm_type used for `clip_grad_norm`.
-        reduce_bucket_size_in_m (int, optional): grad reduce bucket size in M. Defaults to 12.
-        communication_dtype (torch.dtype, optional): communication dtype. If not specified, the dtype of param will be used. Defaults to None.
+        reduce_bucket_size_in_m (int or str, optional): grad reduce bucket size in M. Pass 'auto' to size the
+            bucket from the model at boost time so the largest parameter always fills a bucket on its own. Defaults to 12.
+        communication_dtype (torch.dtype, optional): communication dtype. If not specified, gradients are communicated
+            in bf16 for fp32 training (cast back to fp32 after the collective) and in the param dtype otherwise. Defaults to None.
         overlap_communication (bool, optional): whether to overlap communication and computation. Defaults to True.
         cpu_offload (bool, optional): whether to offload grad, master weight and optimizer state to cpu. Defaults to False.
         verbose (bool, optional): verbose mode. Debug info including grad overflow will be printed. Defaults to False.
         use_fp8 (bool, optional): Whether to enable fp8 mixed precision training. Defaults to False.
         fp8_communication (bool, optional): Whether to enable fp8 communication. Defaults to False.
+        compile (bool, optional): Whether to wrap the model with ``torch.compile`` after it is moved to
+            the device. Requires torch>=2.0.0. Defaults to False.
     """
 
     def __init__(
@@ -348,7 +406,7 @@ class LowLevelZeroPlugin(DPPluginBase):
         max_scale: float = 2**32,
         max_norm: float = 0.0,
         norm_type: float = 2.0,
-        reduce_bucket_size_in_m: int = 12,
+        reduce_bucket_size_in_m: Union[int, str] = 12,
         communication_dtype: Optional[torch.dtype] = None,
         overlap_communication: bool = True,
         overlap_allgather: bool = False,
@@ -358,6 +416,7 @@ class LowLevelZeroPlugin(DPPluginBase):
         cast_inputs: bool = True,
         fp8_communication: bool = False,
         use_fp8: bool = False,
+        compile: bool = False,
     ) -> None:
         super().__init__()
         assert stage in (1, 2), f"LowLevelZeroPlugin only supports stage 1/2 training"
@@ -365,6 +424,16 @@ class LowLevelZeroPlugin(DPPluginBase):
         assert norm_type == 2.0, f"LowLevelZeroPlugin only supports norm_type=2.0 now"
         self.stage = stage
         self.precision = precision
+        self._auto_reduce_bucket_size = reduce_bucket_size_in_m == "auto"
+        if self._auto_reduce_bucket_size:
+            # placeholder, resized from the model in configure()
+            reduce_bucket_size_in_m = 12
+        if communication_dtype is None and precision in ("fp32", "tf32"):
+            # for fp32 training the gradients travel the wire in bf16 and are cast
+            # back to fp32 right after the collective, halving the bandwidth of the
+            # dominant reduce without touching compute or master-weight dtypes;
+            # fp16/bf16 training already communicates at 16-bit width
+            communication_dtype = torch.bfloat16
         self.zero_optim_kwargs = dict(
             initial_scale=initial_scale,
             min_scale=min_scale,
@@ -389,6 +458,7 @@ class LowLevelZeroPlugin(DPPluginBase):
         self.cast_inputs = cast_inputs
 
         self.use_fp8 = use_fp8
+        self.compile = compile
         # set class name with stage, for better error message
         setattr(self.__class__, "__name__", f"LowLevelZeroPlugin_ZeRO-{stage}")
 
@@ -508,11 +578,18 @@ class LowLevelZeroPlugin(DPPluginBase):
                 overlap_allgather=self.zero_optim_kwargs["overlap_allgather"],
                 cast_inputs=self.cast_inputs,
                 use_fp8=self.use_fp8,
+                compile=self.compile,
             )
 
         # TODO: Support Galore + ZeRO
         zero_stage = self.stage
         zero_optim_kwargs = {**self.zero_optim_kwargs}
+        if self._auto_reduce_bucket_size:
+            # size the bucket so the largest parameter never spills into a lone
+            # undersized collective, clamped so many-tiny-param models do not end up
+            # with one huge serialized reduction
+            largest_param_numel = max((p.numel() for p in model.parameters() if p.requires_grad), default=0)
+            zero_optim_kwargs["reduce_bucket_size"] = max(12 * 1024 * 1024, min(128 * 1024 * 1024, largest_param_numel))
         dp_size = dist.get_world_size()
 
         # Replace with the distributed implementation if exists
@@ -860,14 +860,31 @@ class HybridParallelCheckpointIO(GeneralCheckpointIO):
         current_shape = param.shape
         state_ = state if inplace else copy.deepcopy(state)
 
+        # Fuse the Zero gathers of all state tensors of this param into one
+        # collective: the shards (e.g. exp_avg / exp_avg_sq) share a shape, so they
+        # are stacked, gathered once and unstacked, instead of paying one collective
+        # launch per state key.
+        gathered_zero = None
+        if use_zero:
+            zero_keys = [k for k, v in state_.items() if isinstance(v, torch.Tensor) and k != "step"]
+            if len(zero_keys) > 1 and len({state_[k].numel() for k in zero_keys}) == 1:
+                shards = torch.stack([state_[k].to(get_current_device()).flatten() for k in zero_keys])
+                flat_gathered = torch.empty(dp_size * shards.numel(), dtype=shards.dtype, device=shards.device)
+                dist.all_gather_into_tensor(flat_gathered, shards, group=dp_group)
+                per_key_view = flat_gathered.view(dp_size, len(zero_keys), -1)
+                gathered_zero = {k: per_key_view[:, i].reshape(-1) for i, k in enumerate(zero_keys)}
+
         for k, v in state_.items():
             if isinstance(v, torch.Tensor) and k != "step":
                 # First gather Zero shards.
                 if use_zero:
-                    v = v.to(get_current_device())
-                    gather_tensor = [torch.zeros_like(v) for _ in range(dp_size)]
-                    dist.all_gather(gather_tensor, v, group=dp_group)
-                    v = torch.stack(gather_tensor).view(-1)[: param.numel()].reshape_as(param)
+                    if gathered_zero is not None:
+                        v = gathered_zero[k][: param.numel()].reshape_as(param)
+                    else:
+                        v = v.to(get_current_device())
+                        gather_tensor = [torch.zeros_like(v) for _ in range(dp_size)]
+                        dist.all_gather(gather_tensor, v, group=dp_group)
+                        v = torch.stack(gather_tensor).view(-1)[: param.numel()].reshape_as(param)
 
                 # Then gather TP shards.
                 partition_dim = search_tp_partition_dim(current_shape, original_shape, tp_size)
@@ -2,7 +2,7 @@ import json
 import os
 from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, Iterable, List, Union
 
 from .utils import is_dtensor_checkpoint
 
@@ -88,6 +88,16 @@ class CheckpointIndexFile:
         """
         self.weight_map[param_name] = shard_file
 
+    def append_weight_maps(self, param_names: Iterable[str], shard_file: str):
+        """
+        Append weight map entries for a whole shard at once.
+
+        Args:
+            param_names (Iterable[str]): names of the parameters stored in the shard.
+            shard_file (str): name of the shard file.
+        """
+        self.weight_map.update((param_name, shard_file) for param_name in param_names)
+
     def append_meta_data(self, name: str, val: Any):
         """
         Append a metadata entry to the index file.
@@ -62,6 +62,9 @@ class HostInfoList:
 
     def __init__(self):
         self.hostinfo_list = []
+        # hostname -> HostInfo index so that membership tests and lookups stay O(1)
+        # even for hostfiles with thousands of entries
+        self._hostinfo_by_name = {}
 
     def append(self, hostinfo: HostInfo) -> None:
         """
@@ -72,6 +75,7 @@ class HostInfoList:
         """
 
         self.hostinfo_list.append(hostinfo)
+        self._hostinfo_by_name[hostinfo.hostname] = hostinfo
 
     def remove(self, hostname: str) -> None:
         """
@@ -83,6 +87,7 @@ class HostInfoList:
 
         hostinfo = self.get_hostinfo(hostname)
         self.hostinfo_list.remove(hostinfo)
+        del self._hostinfo_by_name[hostname]
 
     def get_hostinfo(self, hostname: str) -> HostInfo:
         """
@@ -95,11 +100,10 @@ class HostInfoList:
             hostinfo (HostInfo): the HostInfo object which matches with the hostname
         """
 
-        for hostinfo in self.hostinfo_list:
-            if hostinfo.hostname == hostname:
-                return hostinfo
-
-        raise Exception(f"Hostname {hostname} is not found")
+        try:
+            return self._hostinfo_by_name[hostname]
+        except KeyError:
+            raise Exception(f"Hostname {hostname} is not found")
 
     def has(self, hostname: str) -> bool:
         """
@@ -111,10 +115,7 @@ class HostInfoList:
         Returns:
             bool: True if added, False otherwise
         """
-        for hostinfo in self.hostinfo_list:
-            if hostinfo.hostname == hostname:
-                return True
-        return False
+        return hostname in self._hostinfo_by_name
 
     def __iter__(self):
         return iter(self.hostinfo_list)
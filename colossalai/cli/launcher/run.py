@@ -1,5 +1,6 @@
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
 
 import click
@@ -14,6 +15,11 @@ from .multinode_runner import MultiNodeRunner
 # Constants that define our syntax
 NODE_SEP = ","
 
+# parse the torch version once at import time; get_launch_command is called
+# once per host and version.parse is regex-based
+_TORCH_VERSION = version.parse(torch.__version__)
+assert _TORCH_VERSION.major >= 1
+
 
 def fetch_hostfile(hostfile_path: str, ssh_port: int) -> HostInfoList:
     """
@@ -37,20 +43,19 @@ def fetch_hostfile(hostfile_path: str, ssh_port: int) -> HostInfoList:
     with open(hostfile_path, "r") as fd:
         device_pool = HostInfoList()
 
-        for line in fd.readlines():
-            line = line.strip()
-            if line == "":
+        # iterate lazily instead of materializing the whole file with readlines()
+        for line in fd:
+            hostname = line.strip()
+            if hostname == "":
                 # skip empty lines
                 continue
 
-            # build the HostInfo object
-            hostname = line.strip()
-            hostinfo = HostInfo(hostname=hostname, port=ssh_port)
-
             if device_pool.has(hostname):
                 click.echo(f"Error: found duplicate host {hostname} in the hostfile")
                 exit()
 
+            # build the HostInfo object
+            hostinfo = HostInfo(hostname=hostname, port=ssh_port)
             device_pool.append(hostinfo)
     return device_pool
 
@@ -142,19 +147,15 @@ def get_launch_command(
         return ret
 
     if extra_launch_args:
-        extra_launch_args_dict = dict()
-        for arg in extra_launch_args.split(","):
-            if "=" in arg:
-                k, v = arg.split("=")
-                extra_launch_args_dict[k] = v
-            else:
-                extra_launch_args_dict[arg] = None
-        extra_launch_args = extra_launch_args_dict
+        # partition splits on the first '=' only, so values containing '=' (e.g. JSON)
+        # survive; flag-style args map to None
+        extra_launch_args = dict(
+            arg.partition("=")[::2] if "=" in arg else (arg, None) for arg in extra_launch_args.split(",")
+        )
     else:
         extra_launch_args = dict()
 
-    torch_version = version.parse(torch.__version__)
-    assert torch_version.major >= 1
+    torch_version = _TORCH_VERSION
 
     if torch_version.major == 1 and torch_version.minor < 9:
         # torch distributed launch cmd with torch < 1.9
@@ -249,7 +250,9 @@ def launch_multi_processes(args: Config) -> None:
     else:
         active_device_pool = None
 
-    env = os.environ.copy()
+    # collect env vars to forward to the remote hosts in a single pass;
+    # multi-line values are not supported
+    env = {k: v for k, v in os.environ.items() if v and "\n" not in v}
 
     # use hosts if hostfile is not given
     if args.host and active_device_pool is None:
@@ -270,32 +273,34 @@ def launch_multi_processes(args: Config) -> None:
     runner = MultiNodeRunner()
     curr_path = os.path.abspath(".")
 
-    # collect current path env
-    env = dict()
-    for k, v in os.environ.items():
-        # do not support multi-line env var
-        if v and "\n" not in v:
-            env[k] = v
-
-    # establish remote connection
-    runner.connect(host_info_list=active_device_pool, workdir=curr_path, env=env)
-
     # overwrite master addr when num_nodes > 1 and not specified
     if len(active_device_pool) > 1 and args.master_addr == "127.0.0.1":
         args.master_addr = active_device_pool.hostinfo_list[0].hostname
 
-    # execute distributed launching command
-    for node_id, hostinfo in enumerate(active_device_pool):
-        cmd = get_launch_command(
-            master_addr=args.master_addr,
-            master_port=args.master_port,
-            nproc_per_node=args.nproc_per_node,
-            user_script=args.user_script,
-            user_args=args.user_args,
-            node_rank=node_id,
-            num_nodes=len(active_device_pool),
-            extra_launch_args=args.extra_launch_args,
+    # the launch commands do not depend on the connections, so build them while
+    # the remote sessions are being established in the background
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        connect_future = executor.submit(
+            runner.connect, host_info_list=active_device_pool, workdir=curr_path, env=env
         )
+        cmds = [
+            get_launch_command(
+                master_addr=args.master_addr,
+                master_port=args.master_port,
+                nproc_per_node=args.nproc_per_node,
+                user_script=args.user_script,
+                user_args=args.user_args,
+                node_rank=node_id,
+                num_nodes=len(active_device_pool),
+                extra_launch_args=args.extra_launch_args,
+            )
+            for node_id, _ in enumerate(active_device_pool)
+        ]
+        connect_future.result()
+
+    # execute distributed launching command; send is a local pipe write per host,
+    # the actual execution happens in the per-host worker processes
+    for hostinfo, cmd in zip(active_device_pool, cmds):
         runner.send(hostinfo=hostinfo, cmd=cmd)
 
     # start training
@@ -1,3 +1,4 @@
+from functools import wraps
 from typing import Callable
 
 import torch
@@ -25,18 +26,21 @@ def compatibility(is_backward_compatible: bool = False) -> Callable:
         Callable: The decorated function
     """
 
-    def decorator(func):
-        if META_COMPATIBILITY:
+    # decide once per decorator application; the common compatible case then
+    # returns the function untouched without building a wrapper
+    if META_COMPATIBILITY or is_backward_compatible:
+
+        def decorator(func):
             return func
-        else:
-            if is_backward_compatible:
-                return func
-            else:
 
-                def wrapper(*args, **kwargs):
-                    raise RuntimeError(f"Function `{func.__name__}` is not compatible with PyTorch {torch.__version__}")
+    else:
+
+        def decorator(func):
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                raise RuntimeError(f"Function `{func.__name__}` is not compatible with PyTorch {torch.__version__}")
 
-                return wrapper
+            return wrapper
 
     return decorator
 
@@ -1,6 +1,6 @@
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, List
+from typing import Dict, List, Union
 
 from torch.fx import Graph, Node
 
@@ -73,7 +73,49 @@ def is_phase(n: Node, phase: Phase) -> bool:
 
 
 @compatibility(is_backward_compatible=False)
-def autograd_graph_analysis(graph: Graph) -> GraphInfo:
+class ProfNode:
+    """
+    A lightweight stand-in for `torch.fx.Node` used by the meta profiler.
+    It only carries the attributes `autograd_graph_analysis` and `is_inplace`
+    read (`op`, `target`, `kwargs`, `meta`, `users`, `all_input_nodes`),
+    skipping the name mangling, op validation and linked-list insertion done
+    by `Graph.create_node` for every aten op.
+    """
+
+    __slots__ = ("op", "target", "kwargs", "meta", "users", "all_input_nodes")
+
+    def __init__(self, op: str, target, input_nodes: List["ProfNode"], kwargs: Dict = None):
+        self.op = op
+        self.target = target
+        self.kwargs = kwargs if isinstance(kwargs, dict) else {}
+        self.meta = {}
+        # mirror `torch.fx.Node` semantics: both users and inputs are deduplicated
+        self.users = {}
+        self.all_input_nodes = list(dict.fromkeys(input_nodes))
+        for node in self.all_input_nodes:
+            node.users[self] = None
+
+    def __repr__(self):
+        return f"ProfNode[{self.op}]({self.target})"
+
+
+@compatibility(is_backward_compatible=False)
+class ProfGraph:
+    """An append-only collection of :class:`ProfNode` in creation order."""
+
+    __slots__ = ("nodes",)
+
+    def __init__(self):
+        self.nodes = []
+
+    def add_node(self, op: str, target, input_nodes: List[ProfNode], kwargs: Dict = None) -> ProfNode:
+        node = ProfNode(op, target, input_nodes, kwargs)
+        self.nodes.append(node)
+        return node
+
+
+@compatibility(is_backward_compatible=False)
+def autograd_graph_analysis(graph: Union[Graph, ProfGraph]) -> GraphInfo:
     """Analyze the autograd node dependencies and find out the memory usage.
     Basically the input graph should have all nodes marked for keyword `phase`.
     Nodes should have attribute `out` indicating the output of each node.
@@ -92,7 +134,7 @@ def autograd_graph_analysis(graph: Graph) -> GraphInfo:
                                l
     =============================================================================
     Args:
-        graph (Graph): The autograd graph with nodes marked for keyword `phase`.
+        graph (Union[Graph, ProfGraph]): The autograd graph with nodes marked for keyword `phase`.
 
     Returns:
         graph_info (GraphInfo): Meta information for the dataflow.
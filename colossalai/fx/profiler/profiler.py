@@ -3,14 +3,13 @@ from functools import partial
 from typing import Any, Callable, Dict, Tuple
 
 import torch
-from torch.fx import Graph, Node
 from torch.fx.node import Argument, Target
 from torch.nn.parameter import Parameter
-from torch.utils._pytree import tree_map
+from torch.utils._pytree import tree_flatten, tree_map, tree_unflatten
 
 from .._compatibility import compatibility
 from .constants import ALIAS_ATEN, OUTPUT_SAVED_MOD, OUTPUT_SAVED_OPS
-from .dataflow import GraphInfo, Phase, autograd_graph_analysis, is_phase
+from .dataflow import GraphInfo, Phase, ProfGraph, ProfNode, autograd_graph_analysis, is_phase
 from .memory_utils import activation_size, parameter_size
 from .opcount import flop_mapping
 from .tensor import MetaTensor
@@ -31,8 +30,15 @@ def normalize_tuple(x):
     return x
 
 
+# checking dtype membership avoids the per-call dispatcher trip of
+# Tensor.is_floating_point() in the profiling hot loop
+_FLOAT_DTYPES = frozenset(
+    {torch.float16, torch.bfloat16, torch.float32, torch.float64, torch.float8_e4m3fn, torch.float8_e5m2}
+)
+
+
 def is_autogradable(x):
-    return isinstance(x, torch.Tensor) and x.is_floating_point()
+    return isinstance(x, torch.Tensor) and x.dtype in _FLOAT_DTYPES
 
 
 def detach_variables(x):
@@ -158,8 +164,10 @@ def _profile_meta(target: Callable, *args, **kwargs) -> Tuple[Tuple[Any, ...], G
         out (Tuple[Any, ...]): The argument value that was retrieved.
         meta_info (GraphInfo): The memory cost and FLOPs estimated with `MetaTensor`.
     """
-    # This subgraph traces aten level ops inside one node.
-    subgraph = Graph()
+    # This subgraph traces aten level ops inside one node. A lightweight
+    # ProfGraph is enough here: the dataflow analysis only needs node meta,
+    # users and creation order, not a full fx graph.
+    subgraph = ProfGraph()
 
     # `flop_count`` serves as a global dictionary to store results.
     flop_count = {
@@ -174,7 +182,7 @@ def _profile_meta(target: Callable, *args, **kwargs) -> Tuple[Tuple[Any, ...], G
     # backward is executed.
     # Hopefully, this attempt will provide a better estimation of memory.
     class FlopTensor(MetaTensor):
-        _node: Node = None
+        _node: ProfNode = None
 
         def __repr__(self):
             if self.grad_fn:
@@ -183,9 +191,12 @@ def _profile_meta(target: Callable, *args, **kwargs) -> Tuple[Tuple[Any, ...], G
 
         @classmethod
         def __torch_dispatch__(cls, func, types, args=(), kwargs=None):
-            args_node = tree_map(lambda x: x._node if isinstance(x, FlopTensor) else None, args)
-            kwargs_node = tree_map(lambda x: x._node if isinstance(x, FlopTensor) else None, kwargs)
-            node = subgraph.create_node("call_function", func, args_node, kwargs_node)
+            # flatten args and kwargs together so the node extraction walks the
+            # pytree once instead of running two recursive tree_map passes
+            flat_args, in_spec = tree_flatten((args, kwargs))
+            flat_nodes = [x._node if isinstance(x, FlopTensor) else None for x in flat_args]
+            _, kwargs_node = tree_unflatten(flat_nodes, in_spec)
+            node = subgraph.add_node("call_function", func, [n for n in flat_nodes if n is not None], kwargs_node)
 
             out = super().__torch_dispatch__(func, types, args, kwargs)
 
@@ -204,26 +215,21 @@ def _profile_meta(target: Callable, *args, **kwargs) -> Tuple[Tuple[Any, ...], G
             if phase == Phase.BACKWARD:
                 node.meta["saved_tensor"] = normalize_tuple(out)
 
-            def wrap(x):
+            # wrap outputs and assign their node in a single flatten/unflatten pair
+            flat_out, out_spec = tree_flatten(out)
+            for idx, x in enumerate(flat_out):
                 if isinstance(x, MetaTensor):
                     x = FlopTensor(x)
                     x._node = node
-                return x
-
-            out = tree_map(wrap, out)
-            return out
+                    flat_out[idx] = x
+            return tree_unflatten(flat_out, out_spec)
 
     def wrap(x):
         if isinstance(x, torch.Tensor):
             x = FlopTensor(x)
             if is_autogradable(x):
                 x.requires_grad_(True)
-            x._node = subgraph.create_node(
-                "placeholder",
-                "placeholder",
-                (subgraph._root,),
-                name=subgraph._graph_namespace.create_name("input", x._tensor),
-            )
+            x._node = subgraph.add_node("placeholder", "placeholder", [])
             x._node.meta["phase"] = Phase.PLACEHOLDER
             x._node.meta["saved_tensor"] = []
         return x
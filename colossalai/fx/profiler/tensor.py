@@ -70,7 +70,9 @@ class MetaTensor(torch.Tensor):
                 x = x._tensor
             elif isinstance(x, torch.Tensor):
                 fake_device = x.device
-                x = x.to(torch.device("meta"))
+                # raw meta tensors need no dispatcher round-trip through to()
+                if not x.is_meta:
+                    x = x.to(torch.device("meta"))
             return x
 
         args = tree_map(unwrap, args)
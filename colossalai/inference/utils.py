@@ -2,6 +2,8 @@
 Utils for model inference
 """
 
+import fnmatch
+import functools
 import math
 import os
 import re
@@ -15,9 +17,36 @@ from torch import nn
 
 from colossalai.logging import get_dist_logger
 from colossalai.testing import free_port
+from colossalai.utils import get_current_device
 
 logger = get_dist_logger(__name__)
 
+# matches index files such as `model.safetensors.index.json`; compiled once at
+# import time instead of on every has_index_file call
+_INDEX_FILE_RE = re.compile(r"(.+?)\.index(\..+)?\.json")
+
+
+@functools.lru_cache(maxsize=8)
+def _build_rope_tables(
+    n_elem: int, max_seq_len: float, base: float, rope_scaling_factor: float, dtype: torch.dtype, device: torch.device
+) -> Tuple[torch.Tensor, torch.Tensor]:
+    """Build the rope cos/sin tables once per distinct configuration.
+
+    Engines spawned with the same model configuration (benchmark loops,
+    multi-model servers) share the cached tables instead of recomputing and
+    re-uploading them; the bounded cache keeps memory growth in check.
+    """
+    # build the tables directly on the device so the large fp32 intermediates
+    # never cross the host-device link; the fp32 freqs buffer is reused in
+    # place for the sin table to halve peak memory
+    inv_freq = 1.0 / (base ** (torch.arange(0, n_elem, 2, device=device, dtype=torch.float32) / n_elem))
+    t = torch.arange(max_seq_len + 1024 * 64, device=device, dtype=torch.float32) / rope_scaling_factor
+    freqs = torch.outer(t, inv_freq)
+
+    cos_cached = torch.cos(freqs).to(dtype)
+    sin_cached = freqs.sin_().to(dtype)
+    return cos_cached, sin_cached
+
 
 def init_to_get_rotary(self, base=10000, use_elem=False):
     """
@@ -56,12 +85,9 @@ def init_to_get_rotary(self, base=10000, use_elem=False):
     if use_elem:
         n_elem //= 2
 
-    inv_freq = 1.0 / (base ** (torch.arange(0, n_elem, 2, device="cpu", dtype=torch.float32) / n_elem))
-    t = torch.arange(max_seq_len + 1024 * 64, device="cpu", dtype=torch.float32) / rope_scaling_factor
-    freqs = torch.outer(t, inv_freq)
-
-    self._cos_cached = torch.cos(freqs).to(self.dtype).cuda()
-    self._sin_cached = torch.sin(freqs).to(self.dtype).cuda()
+    self._cos_cached, self._sin_cached = _build_rope_tables(
+        n_elem, max_seq_len, base, rope_scaling_factor, self.dtype, get_current_device()
+    )
 
 
 def has_index_file(checkpoint_path: str) -> Tuple[bool, Optional[Path]]:
@@ -77,25 +103,28 @@ def has_index_file(checkpoint_path: str) -> Tuple[bool, Optional[Path]]:
     checkpoint_path = Path(checkpoint_path)
     if checkpoint_path.is_file():
         # check if it is .index.json
-        reg = re.compile("(.*?).index((\..*)?).json")
-        if reg.fullmatch(checkpoint_path.name) is not None:
+        if _INDEX_FILE_RE.fullmatch(checkpoint_path.name) is not None:
             return True, checkpoint_path
         else:
             return False, None
     elif checkpoint_path.is_dir():
-        index_files = list(checkpoint_path.glob("*.index.*json"))
-
-        for index_file in index_files:
-            if "safetensors" in index_file.__str__():
-                return True, index_file.__str__()  # return the safetensors file first
-
-        if len(index_files) == 1:
-            return True, index_files[0]
-        else:
-            assert (
-                len(index_files) == 1
-            ), f"Expected to find one .index.json file in {checkpoint_path}, but found {len(index_files)}"
-            return False, None
+        # scan the directory once instead of materializing a glob list and
+        # walking it twice; a safetensors index short-circuits the scan
+        num_index_files = 0
+        index_file = None
+        with os.scandir(checkpoint_path) as entries:
+            for entry in entries:
+                if not fnmatch.fnmatch(entry.name, "*.index.*json"):
+                    continue
+                if "safetensors" in entry.path:
+                    return True, entry.path  # return the safetensors file first
+                num_index_files += 1
+                index_file = entry.name
+
+        assert (
+            num_index_files == 1
+        ), f"Expected to find one .index.json file in {checkpoint_path}, but found {num_index_files}"
+        return True, checkpoint_path / index_file
     else:
         raise RuntimeError(f"Invalid checkpoint path {checkpoint_path}. Expected a file or a directory.")
 
@@ -107,10 +136,7 @@ def get_model_size(model: nn.Module):
     Returns:
         The total size of the model weights in bytes.
     """
-    total_size = 0
-    for key, param in model.named_parameters():
-        total_size += param.element_size() * param.numel()
-    return total_size / (1024**3)
+    return sum(param.nbytes for param in model.parameters()) / (1024**3)
 
 
 def find_available_ports(num: int):
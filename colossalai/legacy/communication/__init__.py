@@ -1,4 +1,4 @@
-from .collective import all_gather, all_reduce, broadcast, reduce, reduce_scatter
+from .collective import all_gather, all_reduce, all_reduce_coalesced, broadcast, reduce, reduce_scatter
 from .p2p import (
     recv_backward,
     recv_forward,
@@ -17,6 +17,7 @@ __all__ = [
     "all_gather",
     "reduce_scatter",
     "all_reduce",
+    "all_reduce_coalesced",
     "broadcast",
     "reduce",
     "send_forward",
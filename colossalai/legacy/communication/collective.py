@@ -1,13 +1,18 @@
 #!/usr/bin/env python
 # -*- encoding: utf-8 -*-
 
+from functools import lru_cache
+from typing import List
+
 import torch
 import torch.distributed as dist
 from torch import Tensor
+from torch._utils import _flatten_dense_tensors, _unflatten_dense_tensors
 from torch.distributed import ReduceOp
 
 from colossalai.legacy.context import ParallelMode
 from colossalai.legacy.core import global_context as gpc
+from colossalai.logging import get_dist_logger
 
 _all_gather_func = dist._all_gather_base if "all_gather_into_tensor" not in dir(dist) else dist.all_gather_into_tensor
 _reduce_scatter_func = (
@@ -15,6 +20,28 @@ _reduce_scatter_func = (
 )
 
 
+# world sizes and process groups are immutable once the parallel context is
+# initialized, so the per-call gpc lookups can be memoized; ParallelContext.destroy
+# clears these caches
+@lru_cache(maxsize=None)
+def _world_size(parallel_mode: ParallelMode) -> int:
+    return gpc.get_world_size(parallel_mode)
+
+
+@lru_cache(maxsize=None)
+def _group(parallel_mode: ParallelMode, cpu: bool = False):
+    return gpc.get_cpu_group(parallel_mode) if cpu else gpc.get_group(parallel_mode)
+
+
+def _ensure_contiguous(tensor: Tensor) -> Tensor:
+    if tensor.is_contiguous():
+        return tensor
+    # contiguous() makes a copy here, so the collective no longer updates the
+    # caller's tensor in place; let the caller know in debug runs
+    get_dist_logger().debug("collective input is not contiguous, a copy is made and in-place semantics are lost")
+    return tensor.contiguous()
+
+
 def all_gather(tensor: Tensor, dim: int, parallel_mode: ParallelMode, async_op: bool = False) -> Tensor:
     r"""Gathers all tensors from the parallel group and concatenates them in a
     specific dimension.
@@ -33,15 +60,19 @@ def all_gather(tensor: Tensor, dim: int, parallel_mode: ParallelMode, async_op:
         Union[tuple(:class:`torch.Tensor`, work handle), :class:`torch.Tensor`]: The result of all-together only,
         if async_op is set to False. A tuple of output of all-gather and Async work handle, if async_op is set to True.
     """
-    depth = gpc.get_world_size(parallel_mode)
+    depth = _world_size(parallel_mode)
     if depth == 1:
         out = tensor
         work = None
     else:
-        tensor_in = tensor.contiguous() if dim == 0 else tensor.transpose(0, dim).contiguous()
+        if dim == 0:
+            # common case: contiguous input gathered along dim 0 needs no copy at all
+            tensor_in = tensor if tensor.is_contiguous() else tensor.contiguous()
+        else:
+            tensor_in = tensor.transpose(0, dim).contiguous()
         out_shape = (tensor_in.shape[0] * depth,) + tensor_in.shape[1:]
         tensor_out = torch.empty(out_shape, dtype=tensor.dtype, device=tensor.device)
-        group = gpc.get_cpu_group(parallel_mode) if tensor.device.type == "cpu" else gpc.get_group(parallel_mode)
+        group = _group(parallel_mode, cpu=tensor.device.type == "cpu")
         work = _all_gather_func(tensor_out, tensor_in, group=group, async_op=async_op)
         out = tensor_out if dim == 0 else tensor_out.transpose(0, dim)
     if async_op:
@@ -74,15 +105,18 @@ def reduce_scatter(
         Union[tuple(:class:`torch.Tensor`, work handle), :class:`torch.Tensor`]: The result of reduce_scatter only,
         if async_op is set to False. A tuple of output of all-gather and Async work handle, if async_op is set to True.
     """
-    depth = gpc.get_world_size(parallel_mode)
+    depth = _world_size(parallel_mode)
     if depth == 1:
         out = tensor
         work = None
     else:
-        tensor_in = tensor.contiguous() if dim == 0 else tensor.transpose(0, dim).contiguous()
+        if dim == 0:
+            tensor_in = tensor if tensor.is_contiguous() else tensor.contiguous()
+        else:
+            tensor_in = tensor.transpose(0, dim).contiguous()
         out_shape = (tensor_in.shape[0] // depth,) + tensor_in.shape[1:]
         tensor_out = torch.empty(out_shape, dtype=tensor.dtype, device=tensor.device)
-        group = gpc.get_cpu_group(parallel_mode) if tensor.device.type == "cpu" else gpc.get_group(parallel_mode)
+        group = _group(parallel_mode, cpu=tensor.device.type == "cpu")
         work = _reduce_scatter_func(tensor_out, tensor_in, op=op, group=group, async_op=async_op)
         out = tensor_out if dim == 0 else tensor_out.transpose(0, dim)
     if async_op:
@@ -113,13 +147,13 @@ def all_reduce(
         Union[tuple(:class:`torch.Tensor`, work handle), :class:`torch.Tensor`]: The result of all-gather only,
         if async_op is set to False. A tuple of output of all-gather and Async work handle, if async_op is set to True.
     """
-    depth = gpc.get_world_size(parallel_mode)
+    depth = _world_size(parallel_mode)
     if depth == 1:
         out = tensor
         work = None
     else:
-        out = tensor.contiguous()
-        group = gpc.get_cpu_group(parallel_mode) if tensor.device.type == "cpu" else gpc.get_group(parallel_mode)
+        out = _ensure_contiguous(tensor)
+        group = _group(parallel_mode, cpu=tensor.device.type == "cpu")
         work = dist.all_reduce(out, op=op, group=group, async_op=async_op)
     if async_op:
         return out, work
@@ -127,6 +161,39 @@ def all_reduce(
         return out
 
 
+def all_reduce_coalesced(tensors: List[Tensor], parallel_mode: ParallelMode, op: ReduceOp = ReduceOp.SUM) -> List[Tensor]:
+    r"""Reduces a list of tensors across the whole parallel group with a single collective.
+
+    Issuing one all-reduce per tensor pays the fixed collective launch cost for
+    every entry; flattening the list into one buffer amortizes that cost over
+    the whole batch, which matters when many small tensors are synchronized.
+
+    Note:
+        The parallel_mode should be concluded in ``ParallelMode``. More details about ``ParallelMode`` could be found
+        in `parallel_mode <https://github.com/hpcaitech/ColossalAI/blob/main/colossalai/context/parallel_mode.py>`_.
+
+    Args:
+        tensors (List[:class:`torch.Tensor`]): Tensors to be all-reduced, updated in place.
+        parallel_mode (:class:`colossalai.legacy.context.ParallelMode`): Parallel group mode used in this communication.
+        op (torch.distributed.ReduceOp, optional): The type of reduce operation,
+            should be included in [SUM, AVG, PRODUCT, MIN, MAX, BAND, BOR, BXOR].
+            More details about ReduceOp please refer to
+            `ReduceOp <https://pytorch.org/docs/stable/distributed.html#torch.distributed.ReduceOp>`_.
+
+    Returns:
+        List[:class:`torch.Tensor`]: The reduced tensors.
+    """
+    depth = _world_size(parallel_mode)
+    if depth == 1 or len(tensors) == 0:
+        return tensors
+    group = _group(parallel_mode, cpu=tensors[0].device.type == "cpu")
+    coalesced = _flatten_dense_tensors(tensors)
+    dist.all_reduce(coalesced, op=op, group=group)
+    for tensor, reduced in zip(tensors, _unflatten_dense_tensors(coalesced, tensors)):
+        tensor.copy_(reduced)
+    return tensors
+
+
 def broadcast(tensor: Tensor, src: int, parallel_mode: ParallelMode, async_op: bool = False):
     r"""Broadcast tensors to whole parallel group. Tensor must have the same
     number of elements in all processes participating in the collective.
@@ -145,13 +212,13 @@ def broadcast(tensor: Tensor, src: int, parallel_mode: ParallelMode, async_op: b
         Union[tuple(:class:`torch.Tensor`, work handle), :class:`torch.Tensor`]: The tensor need to be broadcast only,
         if async_op is set to False. A tuple of output of all-gather and Async work handle, if async_op is set to True.
     """
-    depth = gpc.get_world_size(parallel_mode)
+    depth = _world_size(parallel_mode)
     if depth == 1:
         out = tensor
         work = None
     else:
-        out = tensor.contiguous()
-        group = gpc.get_cpu_group(parallel_mode) if tensor.device.type == "cpu" else gpc.get_group(parallel_mode)
+        out = _ensure_contiguous(tensor)
+        group = _group(parallel_mode, cpu=tensor.device.type == "cpu")
         work = dist.broadcast(out, src=src, group=group, async_op=async_op)
     if async_op:
         return out, work
@@ -177,13 +244,13 @@ def reduce(tensor: Tensor, dst: int, parallel_mode: ParallelMode, op: ReduceOp =
         Union[tuple(:class:`torch.Tensor`, work handle), :class:`torch.Tensor`]: The result of reduce only,
         if async_op is set to False. A tuple of output of all-gather and Async work handle, if async_op is set to True.
     """
-    depth = gpc.get_world_size(parallel_mode)
+    depth = _world_size(parallel_mode)
     if depth == 1:
         out = tensor
         work = None
     else:
-        out = tensor.contiguous()
-        group = gpc.get_cpu_group(parallel_mode) if tensor.device.type == "cpu" else gpc.get_group(parallel_mode)
+        out = _ensure_contiguous(tensor)
+        group = _group(parallel_mode, cpu=tensor.device.type == "cpu")
         work = dist.reduce(out, dst=dst, op=op, group=group, async_op=async_op)
     if async_op:
         return out, work
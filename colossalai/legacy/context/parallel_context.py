@@ -520,6 +520,13 @@ class ParallelContext(metaclass=SingletonMeta):
         dist.destroy_process_group()
         self._groups.clear()
 
+        # drop the memoized world-size/group lookups that point at the
+        # destroyed groups; imported lazily to avoid a circular import
+        from colossalai.legacy.communication.collective import _group, _world_size
+
+        _group.cache_clear()
+        _world_size.cache_clear()
+
     def set_device(self, device_ordinal: int = None):
         """Sets distributed processes to be bound to devices.
 
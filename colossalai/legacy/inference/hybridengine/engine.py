@@ -1,3 +1,5 @@
+from typing import Tuple
+
 import torch
 import torch.distributed as dist
 import torch.nn as nn
@@ -105,8 +107,18 @@ class CaiInferEngine:
         stage_manager = None
         if pp_size > 1:
             stage_manager = PipelineStageManager(pg_mesh, PP_AXIS, True)
+
+        # shard first and start uploading the weights on a dedicated stream, so
+        # the host-to-device copies overlap with the KV cache allocations below
+        self.model = self._shardformer(model, model_policy, stage_manager, pg_mesh.get_group_along_axis(TP_AXIS))
+
+        if pp_size > 1:
+            # the cache shape only depends on the model config, so compute it
+            # once and let the per-microbatch loop do nothing but allocate
+            head_num, head_dim, layer_num = self._compute_kv_shape(model)
+            max_total_token_num = max_batch_size * (max_input_len + max_output_len)
             self.cache_manager_list = [
-                self._init_manager(model, max_batch_size, max_input_len, max_output_len)
+                MemoryManager(max_total_token_num, self.dtype, head_num, head_dim, layer_num)
                 for _ in range(micro_batch_buffer_size or pp_size)
             ]
             self.mb_manager = MicroBatchManager(
@@ -120,7 +132,8 @@ class CaiInferEngine:
             self.verbose = verbose
             self.schedule = GenerateSchedule(stage_manager, self.mb_manager, verbose)
 
-        self.model = self._shardformer(model, model_policy, stage_manager, pg_mesh.get_group_along_axis(TP_AXIS))
+        # the weights must have landed before the first forward
+        torch.cuda.current_stream().wait_stream(self._transfer_stream)
 
     def inference(self, input_list):
         """
@@ -155,16 +168,27 @@ class CaiInferEngine:
         )
         shardformer = ShardFormer(shard_config=shardconfig)
         shard_model, _ = shardformer.optimize(model, model_policy)
-        return shard_model.cuda()
 
-    def _init_manager(self, model, max_batch_size: int, max_input_len: int, max_output_len: int) -> None:
-        max_total_token_num = max_batch_size * (max_input_len + max_output_len)
+        def _upload(t: torch.Tensor) -> torch.Tensor:
+            if t.device.type != "cpu":
+                return t.cuda()
+            # staging through pinned memory makes the copy truly asynchronous;
+            # the caching host allocator keeps the staging buffer alive until
+            # the in-flight copy completes
+            if not t.is_pinned():
+                t = t.pin_memory()
+            return t.cuda(non_blocking=True)
+
+        self._transfer_stream = torch.cuda.Stream()
+        with torch.cuda.stream(self._transfer_stream):
+            shard_model._apply(_upload)
+        return shard_model
+
+    def _compute_kv_shape(self, model) -> Tuple[int, int, int]:
         head_dim = model.config.hidden_size // model.config.num_attention_heads
         head_num = model.config.num_attention_heads
         num_hidden_layers = (
             model.config.num_hidden_layers if hasattr(model.config, "num_hidden_layers") else model.config.num_layers
         )
         layer_num = num_hidden_layers // self.pp_size
-
-        cache_manager = MemoryManager(max_total_token_num, self.dtype, head_num, head_dim, layer_num)
-        return cache_manager
+        return head_num, head_dim, layer_num
@@ -9,31 +9,46 @@ from colossalai.shardformer.policies.bloom import BloomForCausalLMPolicy
 
 from ..modeling.bloom import BloomInferenceForwards
 
-try:
-    from colossalai.kernel.triton import layer_norm
-
-    HAS_TRITON_NORM = True
-except:
-    print("Some of our kernels require triton. You might want to install triton from https://github.com/openai/triton")
-    HAS_TRITON_NORM = False
+# resolved lazily on first use so importing the policy neither pays for the
+# triton import nor warns when triton is absent; False marks a failed attempt
+_triton_layer_norm = None
 
 
 def get_triton_layernorm_forward():
-    if HAS_TRITON_NORM:
-
-        def _triton_layernorm_forward(self: LayerNorm, hidden_states: torch.Tensor):
-            return layer_norm(hidden_states, self.weight.data, self.bias, self.eps)
+    global _triton_layer_norm
+    if _triton_layer_norm is None:
+        try:
+            from colossalai.kernel.triton import layer_norm
+
+            _triton_layer_norm = layer_norm
+        except:
+            print(
+                "Some of our kernels require triton. You might want to install triton from https://github.com/openai/triton"
+            )
+            _triton_layer_norm = False
 
-        return _triton_layernorm_forward
-    else:
+    if _triton_layer_norm is False:
         return None
 
+    triton_layer_norm = _triton_layer_norm
+
+    def _triton_layernorm_forward(self: LayerNorm, hidden_states: torch.Tensor):
+        return triton_layer_norm(hidden_states, self.weight.data, self.bias, self.eps)
+
+    return _triton_layernorm_forward
+
 
 class BloomModelInferPolicy(BloomForCausalLMPolicy):
     def __init__(self) -> None:
         super().__init__()
+        self._policy_cache = None
 
     def module_policy(self):
+        # the policy only depends on the model config and shard config bound to
+        # this instance, so assemble the dict once and reuse it on later queries
+        if self._policy_cache is not None:
+            return self._policy_cache
+
         from transformers.models.bloom.modeling_bloom import BloomAttention, BloomBlock, BloomForCausalLM, BloomModel
 
         policy = super().module_policy()
@@ -92,11 +107,12 @@ class BloomModelInferPolicy(BloomForCausalLMPolicy):
             description=method_replacement, policy=policy, target_key=BloomAttention
         )
 
-        if HAS_TRITON_NORM:
-            infer_method = get_triton_layernorm_forward()
+        infer_method = get_triton_layernorm_forward()
+        if infer_method is not None:
             method_replacement = {"forward": partial(infer_method)}
             self.append_or_create_method_replacement(
                 description=method_replacement, policy=policy, target_key=LayerNorm
             )
 
+        self._policy_cache = policy
         return policy
@@ -340,6 +340,10 @@ class SparseMLP(nn.Module):
                 dispatch_data.shape[0] % NUM_CHUNK == 0
             ), "arbitrary chunk num is not supported yet, please use chunk num that can divide num_experts"
             chunk_size = dispatch_data.shape[0] // NUM_CHUNK
+            # dim-0 chunks of a contiguous tensor are contiguous views themselves,
+            # so one up-front contiguous() replaces a copy per chunk in the loop
+            if not dispatch_data.is_contiguous():
+                dispatch_data = dispatch_data.contiguous()
             chunk_data = torch.split(dispatch_data, chunk_size, dim=0)
             output = torch.empty_like(dispatch_data)
 
@@ -365,7 +369,7 @@ class SparseMLP(nn.Module):
                 # all gather next input
                 if 0 <= i < NUM_CHUNK:
                     _expert_in = Capsule(
-                        *AllGather.apply(chunk_data[i].contiguous(), self.ep_group, True),
+                        *AllGather.apply(chunk_data[i], self.ep_group, True),
                         indices=get_chunk_slice(i, chunk_size),
                     )
 
@@ -40,14 +40,19 @@ class AllGather(torch.autograd.Function):
         if comm_size == 1:
             return inputs.unsqueeze(0), None
 
+        if not inputs.is_contiguous():
+            inputs = inputs.contiguous()
+
+        # gather into one flat buffer instead of a list of chunk views; this
+        # skips building comm_size Python chunk objects per call and lets NCCL
+        # work on a single contiguous output
         buffer_shape = (comm_size,) + inputs.shape
         outputs = torch.empty(buffer_shape, dtype=inputs.dtype, device=inputs.device)
-        buffer_list = list(torch.chunk(outputs, comm_size, dim=0))
         if not overlap:
-            dist.all_gather(buffer_list, inputs, group=group)
+            dist.all_gather_into_tensor(outputs, inputs, group=group)
             return outputs, None
         else:
-            handle = dist.all_gather(buffer_list, inputs, group=group, async_op=True)
+            handle = dist.all_gather_into_tensor(outputs, inputs, group=group, async_op=True)
             return outputs, handle
 
     @staticmethod
@@ -86,12 +91,11 @@ class ReduceScatter(torch.autograd.Function):
 
         output_shape = inputs.shape[1:]
         outputs = torch.empty(output_shape, dtype=inputs.dtype, device=inputs.device)
-        buffer_list = list(torch.chunk(inputs, comm_size, dim=0))
         if not overlap:
-            dist.reduce_scatter(outputs, buffer_list, group=group)
+            dist.reduce_scatter_tensor(outputs, inputs, group=group)
             return outputs, None
         else:
-            handle = dist.reduce_scatter(outputs, buffer_list, group=group, async_op=True)
+            handle = dist.reduce_scatter_tensor(outputs, inputs, group=group, async_op=True)
             return outputs, handle
 
     @staticmethod
@@ -281,15 +285,24 @@ class MoeCombine(torch.autograd.Function):
         return d_expert, d_logits, None, None, None
 
 
+# dim0 -> whether the fused cumsum kernel supports it; the routing dimension
+# changes rarely, so cache the three-comparison decision per size
+_CUMSUM_FLAG_CACHE = {}
+
+
 def moe_cumsum(inputs: Tensor, use_kernel: bool = False):
     dim0 = inputs.size(0)
-    flag = (dim0 <= 1024) or (dim0 <= 2048 and dim0 % 2 == 0) or (dim0 % 4 == 0)
+    flag = _CUMSUM_FLAG_CACHE.get(dim0)
+    if flag is None:
+        flag = (dim0 <= 1024) or (dim0 <= 2048 and dim0 % 2 == 0) or (dim0 % 4 == 0)
+        _CUMSUM_FLAG_CACHE[dim0] = flag
     if flag and use_kernel:
         if MOE_KERNEL is None:
             load_moe()
         return MOE_KERNEL.cumsum_sub_one(inputs)
     else:
-        return torch.cumsum(inputs, dim=0) - 1
+        # in-place sub on the fresh cumsum output avoids a second allocation
+        return torch.cumsum(inputs, dim=0).sub_(1)
 
 
 class EPGradScalerIn(torch.autograd.Function):
@@ -277,14 +277,13 @@ class _GatherForwardReduceScatterBackward(torch.autograd.Function):
         process_group = ctx.process_group
         fp8_communication = ctx.fp8_communication
         # do reduce-scatter
+        world_size = dist.get_world_size(process_group)
         new_shape = list(grad_output.shape)
         assert (
-            new_shape[dim] % dist.get_world_size(process_group) == 0
-        ), f"The dimension to split ({new_shape[dim]}) is not a multiple of tensor parallel size ({dist.get_world_size(process_group)}). "
-        new_shape[dim] = new_shape[dim] // dist.get_world_size(process_group)
-        grad_list = [
-            item.contiguous() for item in torch.chunk(grad_output, dist.get_world_size(process_group), dim=dim)
-        ]
+            new_shape[dim] % world_size == 0
+        ), f"The dimension to split ({new_shape[dim]}) is not a multiple of tensor parallel size ({world_size}). "
+        new_shape[dim] = new_shape[dim] // world_size
+        grad_list = [item.contiguous() for item in torch.chunk(grad_output, world_size, dim=dim)]
         output = torch.empty(new_shape, dtype=grad_output.dtype, device=grad_output.device)
 
         if fp8_communication:
@@ -483,15 +482,14 @@ class _LinearWithReduceScatterForwardGatherBackward(torch.autograd.Function):
             else:
                 partial_output = F.linear(input_, weight)
 
+            world_size = dist.get_world_size(process_group)
             output_shape = list(partial_output.shape)
             assert (
-                output_shape[dim] % dist.get_world_size(process_group) == 0
-            ), f"The dimension to split ({output_shape[dim]}) is not a multiple of tensor parallel size ({dist.get_world_size(process_group)}). "
-            output_shape[dim] = output_shape[dim] // dist.get_world_size(process_group)
+                output_shape[dim] % world_size == 0
+            ), f"The dimension to split ({output_shape[dim]}) is not a multiple of tensor parallel size ({world_size}). "
+            output_shape[dim] = output_shape[dim] // world_size
 
-            output_list = [
-                item.contiguous() for item in torch.chunk(partial_output, dist.get_world_size(process_group), dim=dim)
-            ]
+            output_list = [item.contiguous() for item in torch.chunk(partial_output, world_size, dim=dim)]
             output = torch.empty(output_shape, dtype=partial_output.dtype, device=partial_output.device).contiguous()
             dist.reduce_scatter(output, output_list, group=process_group)
 
@@ -540,12 +538,13 @@ class _ReduceScatterForwardGatherBackward(torch.autograd.Function):
         ctx.fp8_communication = fp8_communication
 
         # do reduce-scatter
+        world_size = dist.get_world_size(process_group)
         new_shape = list(input_.shape)
         assert (
-            new_shape[dim] % dist.get_world_size(process_group) == 0
-        ), f"The dimension to split ({new_shape[dim]}) is not a multiple of tensor parallel size ({dist.get_world_size(process_group)}). "
-        new_shape[dim] = new_shape[dim] // dist.get_world_size(process_group)
-        input_list = [item.contiguous() for item in torch.chunk(input_, dist.get_world_size(process_group), dim=dim)]
+            new_shape[dim] % world_size == 0
+        ), f"The dimension to split ({new_shape[dim]}) is not a multiple of tensor parallel size ({world_size}). "
+        new_shape[dim] = new_shape[dim] // world_size
+        input_list = [item.contiguous() for item in torch.chunk(input_, world_size, dim=dim)]
         output = torch.empty(new_shape, dtype=input_.dtype, device=input_.device)
         if fp8_communication:
             reduce_scatter_fp8(output, input_list, group=process_group, fp8_format="e4m3")
@@ -908,8 +907,8 @@ def _reduce_scatter(input_, dim=1, process_group=None):
     # reduce-scatter
     new_shape = list(input_.shape)
     assert (
-        new_shape[dim] % dist.get_world_size(process_group) == 0
-    ), f"The dimension to split ({new_shape[dim]}) is not a multiple of tensor parallel size ({dist.get_world_size(process_group)}). "
+        new_shape[dim] % world_size == 0
+    ), f"The dimension to split ({new_shape[dim]}) is not a multiple of tensor parallel size ({world_size}). "
     new_shape[dim] = new_shape[dim] // world_size
     output = torch.empty(new_shape, dtype=input_.dtype, device=input_.device)
     dist.reduce_scatter(output, input_, group=process_group)
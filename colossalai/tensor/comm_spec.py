@@ -19,8 +19,10 @@ def _all_gather(tensor, comm_spec):
     process_groups = comm_spec.device_mesh.get_process_group_for_all_axes()
     process_group = process_groups[comm_spec.logical_process_axis]
 
+    # the gather buffers are fully overwritten by the collective, so there is no
+    # need to pay a zero-fill kernel per rank
     tensor_list = [
-        torch.zeros(tensor.shape, dtype=tensor.dtype, device=tensor.device)
+        torch.empty(tensor.shape, dtype=tensor.dtype, device=tensor.device)
         for _ in range(comm_spec.device_mesh.shape[comm_spec.logical_process_axis])
     ]
     # without this contiguous operation, the all gather may get some unexpected results.
@@ -55,7 +57,8 @@ def _all_to_all(tensor, comm_spec):
     new_shape = list(tensor.shape)
     new_shape[comm_spec.shard_dim] = new_shape[comm_spec.shard_dim] // world_size
     new_shape = torch.Size(new_shape)
-    output_tensor_list = [torch.zeros(new_shape, dtype=tensor.dtype, device=tensor.device) for _ in range(world_size)]
+    # fully overwritten by all_to_all, no zero-fill needed
+    output_tensor_list = [torch.empty(new_shape, dtype=tensor.dtype, device=tensor.device) for _ in range(world_size)]
     dim = comm_spec.shard_dim
     length = tensor.shape[comm_spec.shard_dim] // world_size
     input_tensor_list = [torch.narrow(tensor, dim, length * i, length).contiguous() for i in range(world_size)]
@@ -126,7 +129,8 @@ def _mix_gather(tensor, comm_spec):
     tensor_list = [(0,0),(1,0),(2,0),(3,0),(4,0),(5,0),(6,0),(7,0)]
     """
     total_slices = comm_spec.device_mesh.shape[0]
-    tensor_list = [torch.zeros(tensor.shape, dtype=tensor.dtype, device=tensor.device) for _ in range(total_slices)]
+    # fully overwritten by the all_gather below, no zero-fill needed
+    tensor_list = [torch.empty(tensor.shape, dtype=tensor.dtype, device=tensor.device) for _ in range(total_slices)]
     leading_group_dim = comm_spec.logical_process_axes[0]
     assert len(comm_spec.device_mesh.process_groups_dict) == 1
     _, process_group = comm_spec.device_mesh.process_groups_dict[0][0]
@@ -135,29 +139,21 @@ def _mix_gather(tensor, comm_spec):
     # Global all_gather
     dist.all_gather(tensor_list, tensor, group=process_group)
 
-    # This is very ugly. I'm figuring out more elegant methods
-    tensor_list_sorted = [
-        torch.zeros(tensor.shape, dtype=tensor.dtype, device=tensor.device) for _ in range(total_slices)
-    ]
-    for i in range(total_slices):
-        tensor_list_sorted[i] = tensor_list[process_number_list[i]]
-    tensor_list = tensor_list_sorted
+    # reorder by process number; this is a pure permutation of references, so no
+    # placeholder tensors have to be allocated
+    tensor_list = [tensor_list[process_number_list[i]] for i in range(total_slices)]
 
     if comm_spec.logical_process_axes[0] == comm_spec.logical_process_axes[1]:
         output = torch.cat(tuple(tensor_list), comm_spec.gather_dim[0]).contiguous()
     else:
         mesh_shape = comm_spec.device_meshes.shape
         cat_slice = [mesh_shape[comm_spec.logical_process_axes[0]], mesh_shape[comm_spec.logical_process_axes[1]]]
-        tmp_tensor_shape = list(tensor.shape)
-        tmp_tensor_shape[comm_spec.gather_dim[0]] *= cat_slice[0]
-        tmp_tensor_shape = torch.Size(tmp_tensor_shape)
         tmp_tensor_list = [
-            torch.zeros(tmp_tensor_shape, dtype=tensor.dtype, device=tensor.device) for _ in range(cat_slice[1])
-        ]
-        for i in range(cat_slice[1]):
-            tmp_tensor_list[i] = torch.cat(
+            torch.cat(
                 tuple(tensor_list[i * cat_slice[0] : (i + 1) * cat_slice[0]]), comm_spec.gather_dim[0]
             ).contiguous()
+            for i in range(cat_slice[1])
+        ]
         output = torch.cat(tuple(tmp_tensor_list), comm_spec.gather_dim[1]).contiguous()
 
     return output
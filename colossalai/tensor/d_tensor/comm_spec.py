@@ -96,7 +96,9 @@ def _all_gather(tensor: torch.Tensor, comm_spec: CommSpec):
     """
     process_group = comm_spec.process_group_dict[comm_spec.logical_process_axis]
     world_size = dist.get_world_size(process_group)
-    tensor_list = [torch.zeros(tensor.shape, dtype=tensor.dtype, device=tensor.device) for _ in range(world_size)]
+    # the gather buffers are fully overwritten by the collective, so there is no
+    # need to pay a zero-fill kernel per rank
+    tensor_list = [torch.empty(tensor.shape, dtype=tensor.dtype, device=tensor.device) for _ in range(world_size)]
     # without this contiguous operation, the all gather may get some unexpected results.
     tensor = tensor.contiguous()
     dist.all_gather(tensor_list, tensor, group=process_group)
@@ -125,7 +127,8 @@ def _all_to_all(tensor: torch.Tensor, comm_spec: CommSpec):
     new_shape = list(tensor.shape)
     new_shape[comm_spec.shard_dim] = new_shape[comm_spec.shard_dim] // world_size
     new_shape = torch.Size(new_shape)
-    output_tensor_list = [torch.zeros(new_shape, dtype=tensor.dtype, device=tensor.device) for _ in range(world_size)]
+    # fully overwritten by all_to_all, no zero-fill needed
+    output_tensor_list = [torch.empty(new_shape, dtype=tensor.dtype, device=tensor.device) for _ in range(world_size)]
     dim = comm_spec.shard_dim
     length = tensor.shape[comm_spec.shard_dim] // world_size
     input_tensor_list = [torch.narrow(tensor, dim, length * i, length).contiguous() for i in range(world_size)]
@@ -211,6 +211,16 @@ class ShardingSpec:
             ), f"sharding_sequence should not be None, if dim_partition_dict is NoneType object."
             self.convert_shard_sequence_to_dict()
         self._sanity_check()
+        self._refresh_digest()
+
+    def _refresh_digest(self):
+        # structural digest used as a hashable cache key by the autoparallel cost
+        # caches; recomputed whenever the spec is (re-)initialized
+        self._digest = (
+            id(self.device_mesh),
+            tuple(self.entire_shape),
+            tuple(sorted((dim, tuple(axes)) for dim, axes in self.dim_partition_dict.items())),
+        )
 
     def __repr__(self):
         res_list = ["DistSpec:"]
@@ -218,6 +228,22 @@ class ShardingSpec:
         res_list.append(f"\n\tdevice_mesh_shape: {self.device_mesh.shape}")
         return " ".join(res_list)
 
+    def __deepcopy__(self, memo=None):
+        # hand-rolled copy: the device mesh is never mutated through a spec and the
+        # _DimSpec objects are immutable, so both can be shared with the clone; only
+        # the containers that callers mutate are duplicated. This bypasses
+        # copy.deepcopy's reflective attribute walk, which dominates strategy cloning
+        # on the autoparallel solve path.
+        cloned_spec = object.__new__(type(self))
+        if memo is not None:
+            memo[id(self)] = cloned_spec
+        cloned_spec.device_mesh = self.device_mesh
+        cloned_spec.entire_shape = self.entire_shape
+        cloned_spec.dim_partition_dict = {dim: list(shard_list) for dim, shard_list in self.dim_partition_dict.items()}
+        cloned_spec.sharding_sequence = list(self.sharding_sequence) if self.sharding_sequence is not None else None
+        cloned_spec._digest = self._digest
+        return cloned_spec
+
     def _sanity_check(self):
         # make sure all axes in logical device mesh only be used once
         dim_check_list = list(range(self.device_mesh.logical_mesh_id.dim()))
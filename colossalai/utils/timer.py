@@ -14,6 +14,15 @@ class Timer:
         self._start_time = time.time()
         self._elapsed = 0
         self._history = []
+        try:
+            # device events time the enqueued work directly, so measuring does
+            # not force a full-device synchronization in the timed region
+            self._start_event = get_accelerator().Event(enable_timing=True)
+            self._end_event = get_accelerator().Event(enable_timing=True)
+        except RuntimeError:
+            # accelerator without event support (e.g. cpu): fall back to wall clock
+            self._start_event = None
+            self._end_event = None
 
     @property
     def has_history(self):
@@ -25,14 +34,23 @@ class Timer:
         return time.time()
 
     def start(self):
-        """Firstly synchronize cuda, reset the clock and then start the timer."""
+        """Reset the clock and then start the timer."""
         self._elapsed = 0
-        get_accelerator().synchronize()
-        self._start_time = time.time()
+        if self._start_event is not None:
+            # recording on the current stream orders the timer after all the
+            # work already enqueued, no host-side sync needed
+            self._start_event.record()
+        else:
+            get_accelerator().synchronize()
+            self._start_time = time.time()
         self._started = True
 
     def lap(self):
         """lap time and return elapsed time"""
+        if self._start_event is not None:
+            self._end_event.record()
+            self._end_event.synchronize()
+            return self._start_event.elapsed_time(self._end_event) / 1000
         return self.current_time - self._start_time
 
     def stop(self, keep_in_history: bool = False):
@@ -44,9 +62,14 @@ class Timer:
         Returns:
             int: Start-stop interval.
         """
-        get_accelerator().synchronize()
-        end_time = time.time()
-        elapsed = end_time - self._start_time
+        if self._start_event is not None:
+            self._end_event.record()
+            # wait for the end event only instead of synchronizing the device
+            self._end_event.synchronize()
+            elapsed = self._start_event.elapsed_time(self._end_event) / 1000
+        else:
+            get_accelerator().synchronize()
+            elapsed = time.time() - self._start_time
         if keep_in_history:
             self._history.append(elapsed)
         self._elapsed = elapsed
@@ -272,6 +272,10 @@ class LowLevelZeroOptimizer(OptimizerWrapper):
                 # use fp32 when master_weights is True
                 if self._master_weights is True:
                     splited_param_current_rank = splited_params.detach().clone().float().to(device)
+                    # pinned master shards let the step-time copy back to the device
+                    # run asynchronously instead of stalling before each all-gather
+                    if self._cpu_offload:
+                        splited_param_current_rank = splited_param_current_rank.pin_memory()
                 else:
                     splited_param_current_rank = splited_params
 
@@ -347,16 +351,24 @@ class LowLevelZeroOptimizer(OptimizerWrapper):
                     grad_in_bucket = bucket_store.get_grad()
                     self._update_unpartitoned_grad(bucket_store, grad_in_bucket.values(), flat_grads_per_rank, group_id)
                 else:
-                    flat_grads_list = list(flat_grads.split(len(flat_grads) // bucket_store.world_size))
-                    received_grad = torch.zeros_like(flat_grads_list[0])
                     if self._fp8_communication:
+                        flat_grads_list = list(flat_grads.split(len(flat_grads) // bucket_store.world_size))
+                        received_grad = torch.zeros_like(flat_grads_list[0])
                         reduce_scatter_fp8(
                             received_grad,
                             flat_grads_list,
                             group=bucket_store.torch_pg,
                         )
                     else:
-                        dist.reduce_scatter(received_grad, flat_grads_list, group=bucket_store.torch_pg)
+                        # single-tensor reduce-scatter on the flat buffer: no Python
+                        # list of chunk views and no zero-fill of the output, which is
+                        # fully overwritten by the collective
+                        received_grad = torch.empty(
+                            len(flat_grads) // bucket_store.world_size,
+                            device=flat_grads.device,
+                            dtype=flat_grads.dtype,
+                        )
+                        dist.reduce_scatter_tensor(received_grad, flat_grads, group=bucket_store.torch_pg)
 
                     if received_grad.dtype != grad_dtype:
                         received_grad = received_grad.to(grad_dtype)
@@ -441,9 +453,9 @@ class LowLevelZeroOptimizer(OptimizerWrapper):
 
         self._reduce_grad(self._partition_grads)
 
-        # clear reduced grads
+        # order the default stream after the grad reduction on the comm streams
         if self._overlap_communication:
-            get_accelerator().synchronize()
+            self._wait_reduction_streams()
 
     def backward_by_grad(self, tensor, grad):
         assert not (
@@ -458,9 +470,18 @@ class LowLevelZeroOptimizer(OptimizerWrapper):
             return
         self._reduce_grad(self._partition_grads)
 
-        # clear reduced grads
+        # order the default stream after the grad reduction on the comm streams
         if self._overlap_communication:
-            get_accelerator().synchronize()
+            self._wait_reduction_streams()
+
+    def _wait_reduction_streams(self):
+        # a device-wide synchronize here would block the host until every kernel on
+        # the device finished; making the current stream wait on each bucket's comm
+        # stream gives the same ordering guarantee for everything that consumes the
+        # reduced grads while keeping the host and other streams running
+        current_stream = get_accelerator().current_stream()
+        for bucket_store in self.pg_to_bucket_store.values():
+            current_stream.wait_stream(bucket_store.comm_stream)
 
     def zero_bucket_stores(self):
         for bucket_store in self.pg_to_bucket_store.values():
@@ -573,7 +594,10 @@ class LowLevelZeroOptimizer(OptimizerWrapper):
             master_working_param = self.optim.param_groups[group_id]["params"]
             for idx, master_param in enumerate(master_working_param):
                 working_param = real_working_params[group_id][idx]
-                param_to_gather = master_param.to(device).to(self._dtype)
+                # non-blocking H2D: with cpu offload the master shards are pinned, so
+                # the copy for the next param overlaps the all-gather of the previous
+                # one; stream ordering keeps the subsequent cast and collective correct
+                param_to_gather = master_param.to(device, non_blocking=True).to(self._dtype)
                 pg = self.param_to_pg[working_param]
                 padded_working_param = self._working_param_to_padded_working_param[working_param]
                 if self._overlap_allgather:
@@ -744,11 +768,19 @@ class LowLevelZeroOptimizer(OptimizerWrapper):
                 if isinstance(v, torch.Tensor) and k != "step":
                     working_param = self.master_to_working_param[id(param)]
                     pg = self.param_to_pg[working_param]
-                    gather_tensor = [torch.zeros(v.shape, device=device, dtype=v.dtype) for _ in range(pg.size())]
-                    dist.all_gather(gather_tensor, v.to(device), group=pg)
-                    param_state = (
-                        torch.stack(gather_tensor).view(-1)[: working_param.numel()].reshape_as(working_param).cpu()
-                    )
+                    if pg.size() == 1:
+                        # the local shard already is the full state, no collective or
+                        # device round-trip needed; copy=True keeps the checkpoint
+                        # from aliasing the live optimizer state
+                        param_state = (
+                            v.flatten()[: working_param.numel()].reshape_as(working_param).to("cpu", copy=True)
+                        )
+                    else:
+                        gather_tensor = [torch.zeros(v.shape, device=device, dtype=v.dtype) for _ in range(pg.size())]
+                        dist.all_gather(gather_tensor, v.to(device), group=pg)
+                        param_state = (
+                            torch.stack(gather_tensor).view(-1)[: working_param.numel()].reshape_as(working_param).cpu()
+                        )
                     zero_state[param][k] = param_state
 
         states_dict = self._pack_state(zero_state)
@@ -772,13 +804,21 @@ class LowLevelZeroOptimizer(OptimizerWrapper):
             pg = self.param_to_pg[self.master_to_working_param[id(idx2master[param_idx])]]
             for k, v in state.items():
                 if isinstance(v, torch.Tensor) and k != "step":
-                    padding_size = (pg.size() - v.numel() % pg.size()) % pg.size()
+                    # slice this rank's shard out directly instead of padding the full
+                    # state and splitting it into pg.size() chunks that are discarded
+                    shard_numel = (v.numel() + pg.size() - 1) // pg.size()
+                    start = pg.rank() * shard_numel
                     with torch.no_grad():
                         v = v.flatten()
-                        if padding_size > 0:
-                            v = torch.nn.functional.pad(v, [0, padding_size])
-                        v_list = v.split(v.numel() // pg.size())
-                        zero_state_dict["state"][param_idx][k] = v_list[pg.rank()].detach().clone()
+                        if start + shard_numel <= v.numel():
+                            shard = v.narrow(0, start, shard_numel).detach().clone()
+                        else:
+                            # this rank owns (part of) the zero-padded tail
+                            shard = v.new_zeros(shard_numel)
+                            valid_numel = v.numel() - start
+                            if valid_numel > 0:
+                                shard[:valid_numel].copy_(v[start:])
+                        zero_state_dict["state"][param_idx][k] = shard
 
         self.optim.load_state_dict(zero_state_dict)
 
@@ -814,11 +854,21 @@ class LowLevelZeroOptimizer(OptimizerWrapper):
 
             for k, v in states.items():
                 if isinstance(v, torch.Tensor) and k != "step":
-                    state_tensor = [torch.zeros(v.shape, device=device, dtype=v.dtype) for _ in range(pg.size())]
-                    dist.all_gather(state_tensor, v.to(device), group=pg)
-                    state_tensor = (
-                        torch.stack(state_tensor).view(-1)[: working_param.numel()].reshape_as(working_param).cpu()
-                    )
+                    if pg.size() == 1:
+                        # single-rank group: the local shard already is the full
+                        # state, no collective or device round-trip needed; copy=True
+                        # keeps the checkpoint from aliasing the live optimizer state
+                        state_tensor = (
+                            v.flatten()[: working_param.numel()].reshape_as(working_param).to("cpu", copy=True)
+                        )
+                    else:
+                        # gather into one flat buffer instead of a per-rank tensor list;
+                        # this issues a single collective and skips both the zero-fill of
+                        # the list buffers and the stack/copy of the gathered payload
+                        shard = v.to(device).flatten()
+                        gathered = torch.empty(shard.numel() * pg.size(), device=device, dtype=v.dtype)
+                        dist.all_gather_into_tensor(gathered, shard, group=pg)
+                        state_tensor = gathered[: working_param.numel()].reshape_as(working_param).cpu()
                     current_block_size += state_tensor.numel()
                     current_block[k] = state_tensor
 
@@ -0,0 +1,78 @@
+from copy import deepcopy
+
+import pytest
+import torch
+
+from colossalai.auto_parallel.tensor_shard.utils import update_partition_dim, update_partition_dims_batch
+from colossalai.device.device_mesh import DeviceMesh
+from colossalai.tensor.sharding_spec import ShardingNotDivisibleError, ShardingSpec
+
+
+def build_device_mesh():
+    physical_mesh_id = torch.arange(0, 4)
+    mesh_shape = (2, 2)
+    # [[0, 1]
+    #  [2, 3]]
+    return DeviceMesh(physical_mesh_id, mesh_shape)
+
+
+def test_update_partition_dims_batch_matches_sequential():
+    device_mesh = build_device_mesh()
+
+    # logical (num_embeddings, embedding_dim) specs with different partition layouts,
+    # remapped to physical shapes as in the embedding handlers
+    batch_inputs = [
+        (
+            ShardingSpec(device_mesh, torch.Size([16, 8]), dim_partition_dict={0: [0], 1: [1]}),
+            {0: 0},
+            torch.Size([16, 8]),
+        ),
+        (
+            ShardingSpec(device_mesh, torch.Size([16, 8]), dim_partition_dict={0: [0]}),
+            {0: 1},
+            torch.Size([4, 4, 8]),
+        ),
+        (
+            ShardingSpec(device_mesh, torch.Size([16, 8]), dim_partition_dict={1: [0, 1]}),
+            {1: 0},
+            torch.Size([8, 16]),
+        ),
+    ]
+    sequential_inputs = deepcopy(batch_inputs)
+
+    update_partition_dims_batch(batch_inputs)
+    for sharding_spec, dim_mapping, physical_shape in sequential_inputs:
+        update_partition_dim(sharding_spec, dim_mapping, physical_shape, inplace=True)
+
+    for (batch_spec, _, _), (sequential_spec, _, _) in zip(batch_inputs, sequential_inputs):
+        assert batch_spec.entire_shape == sequential_spec.entire_shape
+        assert batch_spec.dim_partition_dict == sequential_spec.dim_partition_dict
+        assert batch_spec.sharding_sequence == sequential_spec.sharding_sequence
+
+
+def test_update_partition_dims_batch_error_leaves_inputs_unmodified():
+    device_mesh = build_device_mesh()
+
+    valid_spec = ShardingSpec(device_mesh, torch.Size([16, 8]), dim_partition_dict={0: [0]})
+    # dim 0 of size 2 cannot be sharded over the [0, 1] flattened mesh of 4 devices
+    invalid_spec = ShardingSpec(device_mesh, torch.Size([16, 8]), dim_partition_dict={0: [0, 1]})
+    valid_snapshot = deepcopy(valid_spec)
+    invalid_snapshot = deepcopy(invalid_spec)
+
+    with pytest.raises(ShardingNotDivisibleError):
+        update_partition_dims_batch(
+            [
+                (valid_spec, {0: 1}, torch.Size([8, 16])),
+                (invalid_spec, {0: 0}, torch.Size([2, 64])),
+            ]
+        )
+
+    for spec, snapshot in ((valid_spec, valid_snapshot), (invalid_spec, invalid_snapshot)):
+        assert spec.entire_shape == snapshot.entire_shape
+        assert spec.dim_partition_dict == snapshot.dim_partition_dict
+        assert spec.sharding_sequence == snapshot.sharding_sequence
+
+
+if __name__ == "__main__":
+    test_update_partition_dims_batch_matches_sequential()
+    test_update_partition_dims_batch_error_leaves_inputs_unmodified()
@@ -0,0 +1,30 @@
+from colossalai.checkpoint_io import CheckpointIndexFile
+
+
+def test_append_weight_maps_matches_repeated_append():
+    param_names = [
+        "embeddings.word_embeddings.weight",
+        "encoder.layer.0.attention.self.query.weight",
+        "encoder.layer.0.attention.self.query.bias",
+    ]
+    shard_file = "model-00001-of-00002.bin"
+
+    batch_index = CheckpointIndexFile()
+    batch_index.append_weight_maps(param_names, shard_file)
+
+    sequential_index = CheckpointIndexFile()
+    for param_name in param_names:
+        sequential_index.append_weight_map(param_name, shard_file)
+
+    assert batch_index.weight_map == sequential_index.weight_map
+    # the tensor checkpoint order must be preserved as well
+    assert list(batch_index.weight_map.keys()) == param_names
+
+    # appending a second shard extends the map without clobbering the first
+    batch_index.append_weight_maps(["lm_head.weight"], "model-00002-of-00002.bin")
+    sequential_index.append_weight_map("lm_head.weight", "model-00002-of-00002.bin")
+    assert batch_index.weight_map == sequential_index.weight_map
+
+
+if __name__ == "__main__":
+    test_append_weight_maps_matches_repeated_append()